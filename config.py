@@ -5,6 +5,9 @@
 Fichier de configuration centralisé pour tous les supports (voix, braille, haptique, IA, etc.)
 """
 
+import json
+from typing import Optional, TextIO
+
 CONFIG = {
     'voix': {
         'moteur': 'espeak',
@@ -41,4 +44,24 @@ CONFIG = {
 }
 
 def get_config():
-    return CONFIG 
\ No newline at end of file
+    return CONFIG
+
+def get_section(section: str) -> dict:
+    """Renvoie une section de la configuration, ou un dictionnaire vide"""
+    return CONFIG.get(section, {})
+
+def load_config_from_stream(stream: TextIO) -> Optional[dict]:
+    """Charge une configuration JSON depuis un flux texte, ou None si elle est invalide"""
+    try:
+        data = json.load(stream)
+    except ValueError:
+        return None
+    return data if isinstance(data, dict) else None
+
+def load_config(path) -> Optional[dict]:
+    """Charge une configuration JSON depuis un fichier, ou None en cas d'erreur"""
+    try:
+        with open(path, encoding='utf-8') as f:
+            return load_config_from_stream(f)
+    except OSError:
+        return None
@@ -11,11 +11,18 @@ import sys
 import logging
 import threading
 import time
-from typing import Optional, Dict, Set, Callable, List
-import evdev
-from evdev import categorize, ecodes
+from typing import Optional, Dict, Set, Callable, List, Iterable
 import config
 
+# evdev est fourni par l'extra "input" (pip install nvda_linux[input])
+try:
+    import evdev
+    from evdev import categorize, ecodes
+    EVDEV_AVAILABLE = True
+except ImportError:
+    evdev = categorize = ecodes = None
+    EVDEV_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 class KeyState:
@@ -33,7 +40,7 @@ class InputManager:
     
     def __init__(self):
         self.initialized = False
-        self.devices: List[evdev.InputDevice] = []
+        self.devices: List['evdev.InputDevice'] = []
         self.key_state = KeyState()
         self.running = False
         self.thread: Optional[threading.Thread] = None
@@ -43,6 +50,10 @@ class InputManager:
     
     def initialize(self) -> bool:
         """Initialise le gestionnaire d'entrées"""
+        if not EVDEV_AVAILABLE:
+            logger.error("evdev n'est pas installé, installez l'extra nvda_linux[input]")
+            return False
+        
         try:
             # Récupère la configuration
             self.key_state.key_repeat_delay = int(config.get_config('keyboard', 'key_repeat_delay', 500))
@@ -69,7 +80,7 @@ class InputManager:
             logger.error(f"Erreur lors de l'initialisation du gestionnaire d'entrées: {str(e)}")
             return False
     
-    def _is_keyboard_device(self, device: evdev.InputDevice) -> bool:
+    def _is_keyboard_device(self, device: 'evdev.InputDevice') -> bool:
         """Vérifie si le périphérique est un clavier"""
         try:
             capabilities = device.capabilities()
@@ -91,6 +102,15 @@ class InputManager:
             logger.error(f"Erreur lors de l'enregistrement du gestionnaire de touche: {str(e)}")
             return False
     
+    def register_key_handlers(self, key: str, handlers: Iterable[Callable]) -> bool:
+        """Enregistre plusieurs gestionnaires pour une même touche en une seule fois"""
+        try:
+            self.key_handlers.setdefault(key, []).extend(handlers)
+            return True
+        except Exception as e:
+            logger.error(f"Erreur lors de l'enregistrement des gestionnaires de touche: {str(e)}")
+            return False
+    
     def register_modifier_handler(self, modifier: str, handler: Callable) -> bool:
         """Enregistre un gestionnaire de modificateur"""
         try:
@@ -113,7 +133,7 @@ class InputManager:
             logger.error(f"Erreur lors de l'enregistrement du gestionnaire de geste: {str(e)}")
             return False
     
-    def _handle_key_event(self, event: evdev.InputEvent) -> None:
+    def _handle_key_event(self, event: 'evdev.InputEvent') -> None:
         """Gère un événement de touche"""
         try:
             if event.type == ecodes.EV_KEY:
@@ -156,9 +176,9 @@ class InputManager:
     def _trigger_key_handlers(self, key_code: int) -> None:
         """Déclenche les gestionnaires de touche"""
         try:
-            key_name = ecodes.KEY[key_code]
-            if key_name in self.key_handlers:
-                for handler in self.key_handlers[key_name]:
+            handlers = self.key_handlers.get(ecodes.KEY[key_code])
+            if handlers:
+                for handler in handlers:
                     handler()
         except Exception as e:
             logger.error(f"Erreur lors du déclenchement des gestionnaires de touche: {str(e)}")
@@ -275,6 +295,14 @@ def register_key_handler(key: str, handler: Callable) -> bool:
     
     return _input_manager.register_key_handler(key, handler)
 
+def register_key_handlers(key: str, handlers: Iterable[Callable]) -> bool:
+    """Enregistre plusieurs gestionnaires pour une même touche"""
+    if not _input_manager:
+        logger.error("Le gestionnaire d'entrées n'est pas initialisé")
+        return False
+    
+    return _input_manager.register_key_handlers(key, handlers)
+
 def register_modifier_handler(modifier: str, handler: Callable) -> bool:
     """Enregistre un gestionnaire de modificateur"""
     global _input_manager
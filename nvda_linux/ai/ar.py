@@ -16,16 +16,24 @@ import os
 import logging
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Tuple, Union
-import torch
-import numpy as np
-from PIL import Image
-import cv2
-from transformers import (
-    AutoModelForDepthEstimation,
-    AutoImageProcessor,
-    DetrImageProcessor,
-    DetrForObjectDetection,
-)
+
+# Dépendances lourdes fournies par l'extra "ai" (pip install nvda_linux[ai])
+try:
+    import torch
+    import numpy as np
+    from PIL import Image
+    import cv2
+    from transformers import (
+        AutoModelForDepthEstimation,
+        AutoImageProcessor,
+        DetrImageProcessor,
+        DetrForObjectDetection,
+    )
+except ImportError:
+    torch = np = Image = cv2 = None
+    AutoModelForDepthEstimation = AutoImageProcessor = None
+    DetrImageProcessor = DetrForObjectDetection = None
+
 from . import config
 
 logger = logging.getLogger(__name__)
@@ -34,8 +42,18 @@ logger = logging.getLogger(__name__)
 _models: Dict[str, Any] = {}
 _processors: Dict[str, Any] = {}
 
+def _ai_available() -> bool:
+    """Vérifie que l'extra "ai" est installé, sinon journalise comment l'obtenir"""
+    if torch is None:
+        logger.error("Dépendances IA manquantes, installez l'extra nvda_linux[ai]")
+        return False
+    return True
+
 def initialize(models: Dict[str, str], device: str = "cpu"):
     """Initialise les modèles de réalité augmentée"""
+    if not _ai_available():
+        return False
+        
     try:
         for name, model_id in models.items():
             if name == "depth_estimation":
@@ -56,7 +74,7 @@ def cleanup():
     try:
         _models.clear()
         _processors.clear()
-        if torch.cuda.is_available():
+        if torch is not None and torch.cuda.is_available():
             torch.cuda.empty_cache()
         logger.info("Nettoyage des modèles AR terminé")
     except Exception as e:
@@ -68,6 +86,8 @@ def load_model(model_name: str) -> Optional[Any]:
 
 def estimate_depth(model: Any, image_path: str) -> Optional[Dict[str, Any]]:
     """Estime la profondeur dans une image"""
+    if not _ai_available():
+        return None
     try:
         image = Image.open(image_path).convert("RGB")
         processor = _processors["depth_estimation"]
@@ -101,6 +121,8 @@ def estimate_depth(model: Any, image_path: str) -> Optional[Dict[str, Any]]:
 
 def estimate_pose(model: Any, image_path: str) -> Optional[Dict[str, Any]]:
     """Estime la pose et détecte les objets dans une image"""
+    if not _ai_available():
+        return None
     try:
         image = Image.open(image_path).convert("RGB")
         processor = _processors["pose_estimation"]
@@ -16,13 +16,20 @@ import os
 import logging
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Union
-import torch
-from transformers import (
-    AutoModelForSeq2SeqLM,
-    AutoTokenizer,
-    AutoModelForQuestionAnswering,
-    pipeline,
-)
+
+# Dépendances lourdes fournies par l'extra "ai" (pip install nvda_linux[ai])
+try:
+    import torch
+    from transformers import (
+        AutoModelForSeq2SeqLM,
+        AutoTokenizer,
+        AutoModelForQuestionAnswering,
+        pipeline,
+    )
+except ImportError:
+    torch = None
+    AutoModelForSeq2SeqLM = AutoTokenizer = AutoModelForQuestionAnswering = pipeline = None
+
 from . import config
 
 logger = logging.getLogger(__name__)
@@ -31,8 +38,18 @@ logger = logging.getLogger(__name__)
 _models: Dict[str, Any] = {}
 _tokenizers: Dict[str, Any] = {}
 
+def _ai_available() -> bool:
+    """Vérifie que l'extra "ai" est installé, sinon journalise comment l'obtenir"""
+    if torch is None:
+        logger.error("Dépendances IA manquantes, installez l'extra nvda_linux[ai]")
+        return False
+    return True
+
 def initialize(models: Dict[str, str], device: str = "cpu"):
     """Initialise les modèles NLP"""
+    if not _ai_available():
+        return False
+        
     try:
         for name, model_id in models.items():
             if name == "text_summarization":
@@ -56,7 +73,7 @@ def cleanup():
     try:
         _models.clear()
         _tokenizers.clear()
-        if torch.cuda.is_available():
+        if torch is not None and torch.cuda.is_available():
             torch.cuda.empty_cache()
         logger.info("Nettoyage des modèles NLP terminé")
     except Exception as e:
@@ -68,6 +85,8 @@ def load_model(model_name: str) -> Optional[Any]:
 
 def summarize_text(model: Any, text: str, max_length: int = 150) -> Optional[str]:
     """Résume un texte"""
+    if not _ai_available():
+        return None
     try:
         tokenizer = _tokenizers["text_summarization"]
         inputs = tokenizer(text, return_tensors="pt", truncation=True, max_length=512).to(model.device)
@@ -90,6 +109,8 @@ def summarize_text(model: Any, text: str, max_length: int = 150) -> Optional[str
 
 def translate_text(model: Any, text: str, target_lang: str = "en") -> Optional[str]:
     """Traduit un texte"""
+    if not _ai_available():
+        return None
     try:
         tokenizer = _tokenizers["translation"]
         inputs = tokenizer(text, return_tensors="pt", truncation=True).to(model.device)
@@ -109,6 +130,8 @@ def translate_text(model: Any, text: str, target_lang: str = "en") -> Optional[s
 
 def answer_question(model: Any, question: str, context: str) -> Optional[Dict[str, Any]]:
     """Répond à une question sur un contexte"""
+    if not _ai_available():
+        return None
     try:
         tokenizer = _tokenizers["question_answering"]
         inputs = tokenizer(
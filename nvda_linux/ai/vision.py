@@ -15,18 +15,25 @@ import os
 import logging
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Tuple
-import torch
-import numpy as np
-from PIL import Image
-from transformers import (
-    AutoModelForVision2Seq,
-    AutoProcessor,
-    DetrImageProcessor,
-    DetrForObjectDetection,
-    AutoModelForVision2Seq,
-    AutoTokenizer,
-)
-import cv2
+
+# Dépendances lourdes fournies par l'extra "ai" (pip install nvda_linux[ai])
+try:
+    import torch
+    import numpy as np
+    from PIL import Image
+    from transformers import (
+        AutoModelForVision2Seq,
+        AutoProcessor,
+        DetrImageProcessor,
+        DetrForObjectDetection,
+        AutoModelForVision2Seq,
+        AutoTokenizer,
+    )
+    import cv2
+except ImportError:
+    torch = np = Image = cv2 = None
+    AutoModelForVision2Seq = AutoProcessor = AutoTokenizer = None
+    DetrImageProcessor = DetrForObjectDetection = None
 
 logger = logging.getLogger(__name__)
 
@@ -34,8 +41,18 @@ logger = logging.getLogger(__name__)
 _models: Dict[str, Any] = {}
 _processors: Dict[str, Any] = {}
 
+def _ai_available() -> bool:
+    """Vérifie que l'extra "ai" est installé, sinon journalise comment l'obtenir"""
+    if torch is None:
+        logger.error("Dépendances IA manquantes, installez l'extra nvda_linux[ai]")
+        return False
+    return True
+
 def initialize(models: Dict[str, str], device: str = "cpu"):
     """Initialise les modèles de vision"""
+    if not _ai_available():
+        return False
+        
     try:
         for name, model_id in models.items():
             if name == "image_captioning":
@@ -59,7 +76,7 @@ def cleanup():
     try:
         _models.clear()
         _processors.clear()
-        if torch.cuda.is_available():
+        if torch is not None and torch.cuda.is_available():
             torch.cuda.empty_cache()
         logger.info("Nettoyage des modèles de vision terminé")
     except Exception as e:
@@ -69,8 +86,10 @@ def load_model(model_name: str) -> Optional[Any]:
     """Charge un modèle de vision"""
     return _models.get(model_name)
 
-def load_image(image_path: str) -> Optional[Image.Image]:
+def load_image(image_path: str) -> Optional['Image.Image']:
     """Charge et prétraite une image"""
+    if not _ai_available():
+        return None
     try:
         if not os.path.exists(image_path):
             raise FileNotFoundError(f"Image non trouvée: {image_path}")
@@ -83,6 +102,8 @@ def load_image(image_path: str) -> Optional[Image.Image]:
 
 def generate_caption(model: Any, image_path: str) -> Optional[str]:
     """Génère une description d'image"""
+    if not _ai_available():
+        return None
     try:
         image = load_image(image_path)
         if image is None:
@@ -102,6 +123,8 @@ def generate_caption(model: Any, image_path: str) -> Optional[str]:
 
 def detect_objects(model: Any, image_path: str) -> List[Dict[str, Any]]:
     """Détecte et identifie les objets dans une image"""
+    if not _ai_available():
+        return []
     try:
         image = load_image(image_path)
         if image is None:
@@ -134,6 +157,8 @@ def detect_objects(model: Any, image_path: str) -> List[Dict[str, Any]]:
 
 def understand_scene(model: Any, image_path: str) -> Optional[str]:
     """Analyse et comprend le contexte d'une scène"""
+    if not _ai_available():
+        return None
     try:
         image = load_image(image_path)
         if image is None:
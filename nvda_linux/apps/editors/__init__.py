@@ -12,6 +12,7 @@ Gère l'intégration avec divers éditeurs de texte via AT-SPI, notamment :
 import os
 import logging
 import importlib
+import functools
 from typing import Dict, Any, Optional, List, Tuple
 import gi
 gi.require_version('Atspi', '2.0')
@@ -105,6 +106,7 @@ def get_instances() -> Dict[str, Any]:
         logger.error(f"Erreur lors de la récupération des instances d'éditeurs : {str(e)}")
         return {}
 
+@functools.lru_cache(maxsize=32)
 def is_supported(editor_name: str) -> bool:
     """Vérifie si un éditeur est supporté."""
     return editor_name.lower() in EDITOR_MODULES
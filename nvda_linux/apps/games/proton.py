@@ -13,7 +13,7 @@ Gère l'interaction avec les jeux Windows via Proton, incluant :
 
 import os
 import logging
-import subprocess
+import shutil
 import json
 from typing import Dict, Any, Optional, List, Tuple
 import gi
@@ -111,10 +111,9 @@ def find_steam_install_path() -> Optional[str]:
             if os.path.exists(path):
                 return path
                 
-        # Essayer de trouver via which
-        result = subprocess.run(['which', 'steam'], capture_output=True, text=True)
-        if result.returncode == 0:
-            steam_bin = result.stdout.strip()
+        # Chercher l'exécutable dans le PATH
+        steam_bin = shutil.which('steam')
+        if steam_bin:
             # Suivre le lien symbolique
             steam_path = os.path.realpath(steam_bin)
             # Remonter jusqu'au dossier Steam
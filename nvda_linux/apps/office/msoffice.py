@@ -13,7 +13,7 @@ Gère l'interaction avec Microsoft Office via Wine et AT-SPI, incluant :
 
 import os
 import logging
-import subprocess
+import shutil
 from typing import Dict, Any, Optional, List, Tuple
 import gi
 gi.require_version('Atspi', '2.0')
@@ -117,12 +117,7 @@ def cleanup() -> None:
 
 def is_wine_installed() -> bool:
     """Vérifie si Wine est installé."""
-    try:
-        result = subprocess.run(['which', 'wine'], capture_output=True, text=True)
-        return result.returncode == 0
-    except Exception as e:
-        logger.error(f"Erreur lors de la vérification de l'installation de Wine : {str(e)}")
-        return False
+    return shutil.which('wine') is not None
 
 def find_msoffice_instances() -> Dict[str, Atspi.Accessible]:
     """Trouve les instances de Microsoft Office en cours d'exécution."""
@@ -13,6 +13,7 @@ Gère l'intégration avec divers terminaux via AT-SPI, notamment :
 import os
 import logging
 import importlib
+import functools
 from typing import Dict, Any, Optional, List, Tuple
 import gi
 gi.require_version('Atspi', '2.0')
@@ -30,7 +31,7 @@ TERMINAL_MODULES = {
 }
 
 # Variables globales
-_terminal_instances = {}
+_terminal_instances: Dict[str, Any] = {}
 _initialized = False
 
 def initialize() -> bool:
@@ -50,17 +51,17 @@ def initialize() -> bool:
                 module = importlib.import_module(module_path)
                 if hasattr(module, 'initialize'):
                     if module.initialize():
-                        logger.info(f"Module {terminal_name} initialisé avec succès")
+                        logger.info("Module %s initialisé avec succès", terminal_name)
                     else:
-                        logger.warning(f"Échec de l'initialisation du module {terminal_name}")
+                        logger.warning("Échec de l'initialisation du module %s", terminal_name)
             except Exception as e:
-                logger.error(f"Erreur lors du chargement du module {terminal_name} : {str(e)}")
+                logger.error("Erreur lors du chargement du module %s : %s", terminal_name, e)
                 
         _initialized = True
         return True
         
     except Exception as e:
-        logger.error(f"Erreur lors de l'initialisation des modules de terminaux : {str(e)}")
+        logger.error("Erreur lors de l'initialisation des modules de terminaux : %s", e)
         return False
 
 def cleanup() -> None:
@@ -75,14 +76,14 @@ def cleanup() -> None:
                 if hasattr(module, 'cleanup'):
                     module.cleanup()
             except Exception as e:
-                logger.error(f"Erreur lors du nettoyage du module {terminal_name} : {str(e)}")
+                logger.error("Erreur lors du nettoyage du module %s : %s", terminal_name, e)
                 
         _terminal_instances = {}
         _initialized = False
         logger.info("Modules de terminaux nettoyés")
         
     except Exception as e:
-        logger.error(f"Erreur lors du nettoyage des modules de terminaux : {str(e)}")
+        logger.error("Erreur lors du nettoyage des modules de terminaux : %s", e)
 
 def get_instances() -> Dict[str, Any]:
     """Récupère les instances de terminaux en cours d'exécution."""
@@ -98,15 +99,16 @@ def get_instances() -> Dict[str, Any]:
                     if instance:
                         instances[terminal_name] = instance
             except Exception as e:
-                logger.error(f"Erreur lors de la récupération de l'instance {terminal_name} : {str(e)}")
+                logger.error("Erreur lors de la récupération de l'instance %s : %s", terminal_name, e)
                 
         _terminal_instances = instances
         return instances
         
     except Exception as e:
-        logger.error(f"Erreur lors de la récupération des instances de terminaux : {str(e)}")
+        logger.error("Erreur lors de la récupération des instances de terminaux : %s", e)
         return {}
 
+@functools.lru_cache(maxsize=32)
 def is_supported(terminal_name: str) -> bool:
     """Vérifie si un terminal est supporté."""
     return terminal_name.lower() in TERMINAL_MODULES
@@ -120,7 +122,8 @@ def get_terminal_info(terminal_name: Optional[str] = None) -> Dict[str, Any]:
                 
             module = importlib.import_module(TERMINAL_MODULES[terminal_name])
             if hasattr(module, 'get_terminal_info'):
-                return module.get_terminal_info()
+                info: Dict[str, Any] = module.get_terminal_info()
+                return info
             return {}
             
         # Récupérer les informations pour tous les terminaux
@@ -131,12 +134,12 @@ def get_terminal_info(terminal_name: Optional[str] = None) -> Dict[str, Any]:
                 if hasattr(module, 'get_terminal_info'):
                     info[name] = module.get_terminal_info()
             except Exception as e:
-                logger.error(f"Erreur lors de la récupération des informations de {name} : {str(e)}")
+                logger.error("Erreur lors de la récupération des informations de %s : %s", name, e)
                 
         return info
         
     except Exception as e:
-        logger.error(f"Erreur lors de la récupération des informations de terminal : {str(e)}")
+        logger.error("Erreur lors de la récupération des informations de terminal : %s", e)
         return {}
 
 def get_tabs(terminal_name: Optional[str] = None) -> Dict[str, List[Dict[str, Any]]]:
@@ -159,12 +162,12 @@ def get_tabs(terminal_name: Optional[str] = None) -> Dict[str, List[Dict[str, An
                 if hasattr(module, 'get_tabs'):
                     tabs[name] = module.get_tabs()
             except Exception as e:
-                logger.error(f"Erreur lors de la récupération des onglets de {name} : {str(e)}")
+                logger.error("Erreur lors de la récupération des onglets de %s : %s", name, e)
                 
         return tabs
         
     except Exception as e:
-        logger.error(f"Erreur lors de la récupération des onglets : {str(e)}")
+        logger.error("Erreur lors de la récupération des onglets : %s", e)
         return {}
 
 def get_current_tab(terminal_name: Optional[str] = None) -> Dict[str, Any]:
@@ -176,7 +179,8 @@ def get_current_tab(terminal_name: Optional[str] = None) -> Dict[str, Any]:
                 
             module = importlib.import_module(TERMINAL_MODULES[terminal_name])
             if hasattr(module, 'get_current_tab'):
-                return module.get_current_tab()
+                tab: Dict[str, Any] = module.get_current_tab()
+                return tab
             return {}
             
         # Récupérer l'onglet actif pour tous les terminaux
@@ -189,12 +193,12 @@ def get_current_tab(terminal_name: Optional[str] = None) -> Dict[str, Any]:
                     if tab:
                         tabs[name] = tab
             except Exception as e:
-                logger.error(f"Erreur lors de la récupération de l'onglet actif de {name} : {str(e)}")
+                logger.error("Erreur lors de la récupération de l'onglet actif de %s : %s", name, e)
                 
         return tabs
         
     except Exception as e:
-        logger.error(f"Erreur lors de la récupération de l'onglet actif : {str(e)}")
+        logger.error("Erreur lors de la récupération de l'onglet actif : %s", e)
         return {}
 
 def get_cursor_position(terminal_name: Optional[str] = None) -> Dict[str, Tuple[int, int]]:
@@ -219,12 +223,12 @@ def get_cursor_position(terminal_name: Optional[str] = None) -> Dict[str, Tuple[
                     if pos:
                         positions[name] = pos
             except Exception as e:
-                logger.error(f"Erreur lors de la récupération de la position du curseur de {name} : {str(e)}")
+                logger.error("Erreur lors de la récupération de la position du curseur de %s : %s", name, e)
                 
         return positions
         
     except Exception as e:
-        logger.error(f"Erreur lors de la récupération de la position du curseur : {str(e)}")
+        logger.error("Erreur lors de la récupération de la position du curseur : %s", e)
         return {}
 
 def get_selection(terminal_name: Optional[str] = None) -> Dict[str, Tuple[Tuple[int, int], Tuple[int, int]]]:
@@ -249,15 +253,15 @@ def get_selection(terminal_name: Optional[str] = None) -> Dict[str, Tuple[Tuple[
                     if sel:
                         selections[name] = sel
             except Exception as e:
-                logger.error(f"Erreur lors de la récupération de la sélection de {name} : {str(e)}")
+                logger.error("Erreur lors de la récupération de la sélection de %s : %s", name, e)
                 
         return selections
         
     except Exception as e:
-        logger.error(f"Erreur lors de la récupération de la sélection : {str(e)}")
+        logger.error("Erreur lors de la récupération de la sélection : %s", e)
         return {}
 
-def execute_action(terminal_name: str, action: str, **kwargs) -> bool:
+def execute_action(terminal_name: str, action: str, **kwargs: Any) -> bool:
     """Exécute une action dans le terminal spécifié."""
     try:
         if not is_supported(terminal_name):
@@ -265,9 +269,9 @@ def execute_action(terminal_name: str, action: str, **kwargs) -> bool:
             
         module = importlib.import_module(TERMINAL_MODULES[terminal_name])
         if hasattr(module, 'execute_action'):
-            return module.execute_action(action, **kwargs)
+            return bool(module.execute_action(action, **kwargs))
         return False
         
     except Exception as e:
-        logger.error(f"Erreur lors de l'exécution de l'action {action} dans {terminal_name} : {str(e)}")
+        logger.error("Erreur lors de l'exécution de l'action %s dans %s : %s", action, terminal_name, e)
         return False 
\ No newline at end of file
@@ -15,7 +15,7 @@ import logging
 from typing import Dict, Any, Optional, List, Tuple
 import gi
 gi.require_version('Atspi', '2.0')
-from gi.repository import Atspi
+from gi.repository import Atspi, GLib
 
 # Configuration du logger
 logger = logging.getLogger(__name__)
@@ -47,6 +47,38 @@ TERMINATOR_ROLES = {
     'notification': Atspi.Role.NOTIFICATION
 }
 
+# Correspondance inverse rôle AT-SPI -> nom, évite l'appel get_role_name()
+_ROLE_NAMES = {role: name for name, role in TERMINATOR_ROLES.items()}
+
+# Mot-clé recherché dans le nom du bouton associé à chaque action
+_ACTION_KEYWORDS = {
+    'new_panel': 'new panel',
+    'close_panel': 'close panel',
+    'next_panel': 'next panel',
+    'previous_panel': 'previous panel',
+    'split_horizontal': 'split horizontal',
+    'split_vertical': 'split vertical',
+    'new_window': 'new window',
+    'close_window': 'close window',
+    'copy': 'copy',
+    'paste': 'paste',
+    'select_all': 'select all',
+    'find': 'find',
+    'preferences': 'preferences',
+    'zoom_in': 'zoom in',
+    'zoom_out': 'zoom out',
+    'zoom_reset': 'zoom reset',
+    'fullscreen': 'fullscreen'
+}
+
+# Attributs des panneaux : chaînes, puis entiers avec leur valeur par défaut
+_STR_FIELDS = (
+    'id', 'process', 'command', 'working_dir', 'font', 'colors',
+    'profile', 'encoding', 'shell', 'position', 'size'
+)
+_INT_FIELDS = (('rows', '24'), ('columns', '80'), ('scrollback', '1000'))
+_CURRENT_PANEL_INT_FIELDS = _INT_FIELDS + (('cursor_line', '0'), ('cursor_column', '0'))
+
 # Variables globales
 _accessibility_manager = None
 _terminator_instance = None
@@ -69,7 +101,7 @@ def initialize() -> bool:
         return True
         
     except Exception as e:
-        logger.error(f"Erreur lors de l'initialisation de Terminator : {str(e)}")
+        logger.error("Erreur lors de l'initialisation de Terminator : %s", e)
         return False
 
 def cleanup() -> None:
@@ -81,7 +113,7 @@ def cleanup() -> None:
         _accessibility_manager = None
         logger.info("Intégration Terminator nettoyée")
     except Exception as e:
-        logger.error(f"Erreur lors du nettoyage de Terminator : {str(e)}")
+        logger.error("Erreur lors du nettoyage de Terminator : %s", e)
 
 def find_terminator_instance() -> Optional[Atspi.Accessible]:
     """Trouve l'instance de Terminator en cours d'exécution."""
@@ -92,7 +124,7 @@ def find_terminator_instance() -> Optional[Atspi.Accessible]:
                 return app
         return None
     except Exception as e:
-        logger.error(f"Erreur lors de la recherche de Terminator : {str(e)}")
+        logger.error("Erreur lors de la recherche de Terminator : %s", e)
         return None
 
 def get_instance() -> Optional[Atspi.Accessible]:
@@ -101,105 +133,92 @@ def get_instance() -> Optional[Atspi.Accessible]:
 
 def get_terminal_info() -> Dict[str, Any]:
     """Récupère les informations sur l'instance de Terminator."""
-    if not _terminator_instance:
+    inst = _terminator_instance
+    if inst is None:
         return {}
         
     try:
         return {
-            'name': _terminator_instance.get_name(),
-            'role': _terminator_instance.get_role_name(),
-            'version': _terminator_instance.get_attributes().get('version', ''),
-            'pid': _terminator_instance.get_process_id(),
-            'children': len(_terminator_instance.get_children())
+            'name': inst.get_name(),
+            'role': _ROLE_NAMES.get(inst.get_role(), ''),
+            'version': inst.get_attributes().get('version', ''),
+            'pid': inst.get_process_id(),
+            'children': len(inst.get_children())
         }
-    except Exception as e:
-        logger.error(f"Erreur lors de la récupération des informations Terminator : {str(e)}")
+    except (GLib.Error, AttributeError) as e:
+        logger.error("Erreur lors de la récupération des informations Terminator : %s", e)
         return {}
 
+def _build_panel(element: Atspi.Accessible, active: bool,
+                 int_fields: Tuple[Tuple[str, str], ...]) -> Dict[str, Any]:
+    """Construit la description d'un panneau à partir de ses attributs."""
+    attrs = element.get_attributes()
+    panel = {key: attrs.get(key, '') for key in _STR_FIELDS}
+    panel.update({key: int(attrs.get(key, default)) for key, default in int_fields})
+    panel['title'] = element.get_name()
+    panel['active'] = active
+    return panel
+
 def get_panels() -> List[Dict[str, Any]]:
     """Récupère la liste des panneaux ouverts."""
-    if not _terminator_instance:
+    inst = _terminator_instance
+    if inst is None:
         return []
         
     try:
         panels = []
+        panel_role = Atspi.Role.PANEL
+        selected = Atspi.StateType.SELECTED
         def find_panels(element: Atspi.Accessible) -> None:
-            if element.get_role() == Atspi.Role.PANEL:
-                panels.append({
-                    'id': element.get_attributes().get('id', ''),
-                    'title': element.get_name(),
-                    'active': element.get_state_set().contains(Atspi.StateType.SELECTED),
-                    'process': element.get_attributes().get('process', ''),
-                    'command': element.get_attributes().get('command', ''),
-                    'working_dir': element.get_attributes().get('working_dir', ''),
-                    'rows': int(element.get_attributes().get('rows', '24')),
-                    'columns': int(element.get_attributes().get('columns', '80')),
-                    'scrollback': int(element.get_attributes().get('scrollback', '1000')),
-                    'font': element.get_attributes().get('font', ''),
-                    'colors': element.get_attributes().get('colors', ''),
-                    'profile': element.get_attributes().get('profile', ''),
-                    'encoding': element.get_attributes().get('encoding', ''),
-                    'shell': element.get_attributes().get('shell', ''),
-                    'position': element.get_attributes().get('position', ''),
-                    'size': element.get_attributes().get('size', '')
-                })
+            if element.get_role() == panel_role:
+                panels.append(_build_panel(
+                    element,
+                    element.get_state_set().contains(selected),
+                    _INT_FIELDS
+                ))
             for child in element.get_children():
                 find_panels(child)
                 
-        find_panels(_terminator_instance)
+        find_panels(inst)
         return panels
     except Exception as e:
-        logger.error(f"Erreur lors de la récupération des panneaux : {str(e)}")
+        logger.error("Erreur lors de la récupération des panneaux : %s", e)
         return []
 
 def get_current_panel() -> Dict[str, Any]:
     """Récupère les informations sur le panneau actif."""
-    if not _terminator_instance:
+    inst = _terminator_instance
+    if inst is None:
         return {}
         
     try:
+        panel_role = Atspi.Role.PANEL
+        selected = Atspi.StateType.SELECTED
         def find_current_panel(element: Atspi.Accessible) -> Optional[Dict[str, Any]]:
-            if (element.get_role() == Atspi.Role.PANEL and 
-                element.get_state_set().contains(Atspi.StateType.SELECTED)):
-                return {
-                    'id': element.get_attributes().get('id', ''),
-                    'title': element.get_name(),
-                    'active': True,
-                    'process': element.get_attributes().get('process', ''),
-                    'command': element.get_attributes().get('command', ''),
-                    'working_dir': element.get_attributes().get('working_dir', ''),
-                    'rows': int(element.get_attributes().get('rows', '24')),
-                    'columns': int(element.get_attributes().get('columns', '80')),
-                    'scrollback': int(element.get_attributes().get('scrollback', '1000')),
-                    'font': element.get_attributes().get('font', ''),
-                    'colors': element.get_attributes().get('colors', ''),
-                    'profile': element.get_attributes().get('profile', ''),
-                    'encoding': element.get_attributes().get('encoding', ''),
-                    'shell': element.get_attributes().get('shell', ''),
-                    'position': element.get_attributes().get('position', ''),
-                    'size': element.get_attributes().get('size', ''),
-                    'cursor_line': int(element.get_attributes().get('cursor_line', '0')),
-                    'cursor_column': int(element.get_attributes().get('cursor_column', '0'))
-                }
+            if (element.get_role() == panel_role and 
+                element.get_state_set().contains(selected)):
+                return _build_panel(element, True, _CURRENT_PANEL_INT_FIELDS)
             for child in element.get_children():
                 result = find_current_panel(child)
                 if result:
                     return result
             return None
             
-        return find_current_panel(_terminator_instance) or {}
+        return find_current_panel(inst) or {}
     except Exception as e:
-        logger.error(f"Erreur lors de la récupération du panneau actif : {str(e)}")
+        logger.error("Erreur lors de la récupération du panneau actif : %s", e)
         return {}
 
 def get_cursor_position() -> Tuple[int, int]:
     """Récupère la position du curseur."""
-    if not _terminator_instance:
+    inst = _terminator_instance
+    if inst is None:
         return (0, 0)
         
     try:
+        terminal_role = Atspi.Role.TERMINAL
         def find_cursor_position(element: Atspi.Accessible) -> Optional[Tuple[int, int]]:
-            if element.get_role() == Atspi.Role.TERMINAL:
+            if element.get_role() == terminal_role:
                 line = int(element.get_attributes().get('cursor_line', '0'))
                 column = int(element.get_attributes().get('cursor_column', '0'))
                 return (line, column)
@@ -209,19 +228,21 @@ def get_cursor_position() -> Tuple[int, int]:
                     return result
             return None
             
-        return find_cursor_position(_terminator_instance) or (0, 0)
-    except Exception as e:
-        logger.error(f"Erreur lors de la récupération de la position du curseur : {str(e)}")
+        return find_cursor_position(inst) or (0, 0)
+    except (GLib.Error, AttributeError, ValueError) as e:
+        logger.error("Erreur lors de la récupération de la position du curseur : %s", e)
         return (0, 0)
 
 def get_selection() -> Tuple[Tuple[int, int], Tuple[int, int]]:
     """Récupère la sélection actuelle."""
-    if not _terminator_instance:
+    inst = _terminator_instance
+    if inst is None:
         return ((0, 0), (0, 0))
         
     try:
+        terminal_role = Atspi.Role.TERMINAL
         def find_selection(element: Atspi.Accessible) -> Optional[Tuple[Tuple[int, int], Tuple[int, int]]]:
-            if element.get_role() == Atspi.Role.TERMINAL:
+            if element.get_role() == terminal_role:
                 start_line = int(element.get_attributes().get('selection_start_line', '0'))
                 start_column = int(element.get_attributes().get('selection_start_column', '0'))
                 end_line = int(element.get_attributes().get('selection_end_line', '0'))
@@ -233,166 +254,66 @@ def get_selection() -> Tuple[Tuple[int, int], Tuple[int, int]]:
                     return result
             return None
             
-        return find_selection(_terminator_instance) or ((0, 0), (0, 0))
-    except Exception as e:
-        logger.error(f"Erreur lors de la récupération de la sélection : {str(e)}")
+        return find_selection(inst) or ((0, 0), (0, 0))
+    except (GLib.Error, AttributeError, ValueError) as e:
+        logger.error("Erreur lors de la récupération de la sélection : %s", e)
         return ((0, 0), (0, 0))
 
-def execute_action(action: str, **kwargs) -> bool:
+def execute_action(action: str, **kwargs: Any) -> bool:
     """Exécute une action dans Terminator."""
-    if not _terminator_instance:
+    inst = _terminator_instance
+    if inst is None:
         return False
         
     try:
-        if action == 'new_panel':
-            # Créer un nouveau panneau
-            for element in _terminator_instance.get_children():
-                if (element.get_role() == Atspi.Role.PUSH_BUTTON and 
-                    'new panel' in element.get_name().lower()):
-                    return element.do_action(0)  # Action par défaut (clic)
-                    
-        elif action == 'close_panel':
-            # Fermer le panneau actif
-            for element in _terminator_instance.get_children():
-                if (element.get_role() == Atspi.Role.PUSH_BUTTON and 
-                    'close panel' in element.get_name().lower()):
-                    return element.do_action(0)  # Action par défaut (clic)
-                    
-        elif action == 'next_panel':
-            # Passer au panneau suivant
-            for element in _terminator_instance.get_children():
-                if (element.get_role() == Atspi.Role.PUSH_BUTTON and 
-                    'next panel' in element.get_name().lower()):
-                    return element.do_action(0)  # Action par défaut (clic)
-                    
-        elif action == 'previous_panel':
-            # Revenir au panneau précédent
-            for element in _terminator_instance.get_children():
-                if (element.get_role() == Atspi.Role.PUSH_BUTTON and 
-                    'previous panel' in element.get_name().lower()):
-                    return element.do_action(0)  # Action par défaut (clic)
-                    
-        elif action == 'split_horizontal':
-            # Diviser horizontalement
-            for element in _terminator_instance.get_children():
-                if (element.get_role() == Atspi.Role.PUSH_BUTTON and 
-                    'split horizontal' in element.get_name().lower()):
-                    return element.do_action(0)  # Action par défaut (clic)
-                    
-        elif action == 'split_vertical':
-            # Diviser verticalement
-            for element in _terminator_instance.get_children():
-                if (element.get_role() == Atspi.Role.PUSH_BUTTON and 
-                    'split vertical' in element.get_name().lower()):
-                    return element.do_action(0)  # Action par défaut (clic)
-                    
-        elif action == 'new_window':
-            # Créer une nouvelle fenêtre
-            for element in _terminator_instance.get_children():
-                if (element.get_role() == Atspi.Role.PUSH_BUTTON and 
-                    'new window' in element.get_name().lower()):
-                    return element.do_action(0)  # Action par défaut (clic)
-                    
-        elif action == 'close_window':
-            # Fermer la fenêtre
-            for element in _terminator_instance.get_children():
-                if (element.get_role() == Atspi.Role.PUSH_BUTTON and 
-                    'close window' in element.get_name().lower()):
-                    return element.do_action(0)  # Action par défaut (clic)
-                    
-        elif action == 'copy':
-            # Copier la sélection
-            for element in _terminator_instance.get_children():
-                if (element.get_role() == Atspi.Role.PUSH_BUTTON and 
-                    'copy' in element.get_name().lower()):
-                    return element.do_action(0)  # Action par défaut (clic)
-                    
-        elif action == 'paste':
-            # Coller le contenu du presse-papiers
-            for element in _terminator_instance.get_children():
-                if (element.get_role() == Atspi.Role.PUSH_BUTTON and 
-                    'paste' in element.get_name().lower()):
-                    return element.do_action(0)  # Action par défaut (clic)
-                    
-        elif action == 'select_all':
-            # Tout sélectionner
-            for element in _terminator_instance.get_children():
-                if (element.get_role() == Atspi.Role.PUSH_BUTTON and 
-                    'select all' in element.get_name().lower()):
-                    return element.do_action(0)  # Action par défaut (clic)
-                    
-        elif action == 'find':
-            # Rechercher du texte
-            text = kwargs.get('text', '')
-            if not text:
-                return False
-                
-            for element in _terminator_instance.get_children():
-                if (element.get_role() == Atspi.Role.PUSH_BUTTON and 
-                    'find' in element.get_name().lower()):
-                    if not element.do_action(0):  # Action par défaut (clic)
-                        return False
-                        
-                    # Attendre que la boîte de dialogue s'ouvre
-                    # Entrer le texte à rechercher
-                    for child in element.get_children():
-                        if child.get_role() == Atspi.Role.ENTRY:
-                            child.set_text_contents(text)
-                            break
-                            
-                    # Valider
-                    for child in element.get_children():
-                        if (child.get_role() == Atspi.Role.PUSH_BUTTON and 
-                            'ok' in child.get_name().lower()):
-                            return child.do_action(0)
-                            
-        elif action == 'preferences':
-            # Ouvrir les préférences
-            for element in _terminator_instance.get_children():
-                if (element.get_role() == Atspi.Role.PUSH_BUTTON and 
-                    'preferences' in element.get_name().lower()):
-                    return element.do_action(0)  # Action par défaut (clic)
-                    
-        elif action == 'zoom_in':
-            # Agrandir le texte
-            for element in _terminator_instance.get_children():
-                if (element.get_role() == Atspi.Role.PUSH_BUTTON and 
-                    'zoom in' in element.get_name().lower()):
-                    return element.do_action(0)  # Action par défaut (clic)
-                    
-        elif action == 'zoom_out':
-            # Réduire le texte
-            for element in _terminator_instance.get_children():
-                if (element.get_role() == Atspi.Role.PUSH_BUTTON and 
-                    'zoom out' in element.get_name().lower()):
-                    return element.do_action(0)  # Action par défaut (clic)
-                    
-        elif action == 'zoom_reset':
-            # Réinitialiser le zoom
-            for element in _terminator_instance.get_children():
-                if (element.get_role() == Atspi.Role.PUSH_BUTTON and 
-                    'zoom reset' in element.get_name().lower()):
-                    return element.do_action(0)  # Action par défaut (clic)
-                    
-        elif action == 'fullscreen':
-            # Passer en plein écran
-            for element in _terminator_instance.get_children():
-                if (element.get_role() == Atspi.Role.PUSH_BUTTON and 
-                    'fullscreen' in element.get_name().lower()):
-                    return element.do_action(0)  # Action par défaut (clic)
-                    
-        elif action == 'click':
+        if action == 'click':
             element = kwargs.get('element')
             if element:
-                return element.do_action(0)  # Action par défaut (clic)
-                
-        elif action == 'focus':
+                return bool(element.do_action(0))  # Action par défaut (clic)
+            return False
+            
+        if action == 'focus':
             element = kwargs.get('element')
             if element:
-                return element.do_action(1)  # Action par défaut (focus)
+                return bool(element.do_action(1))  # Action par défaut (focus)
+            return False
+            
+        keyword = _ACTION_KEYWORDS.get(action)
+        if keyword is None:
+            return False
+            
+        text = kwargs.get('text', '')
+        if action == 'find' and not text:
+            return False
+            
+        # Un seul parcours des enfants, chaque nom n'est mis en minuscules qu'une fois
+        push_button = Atspi.Role.PUSH_BUTTON
+        for element in inst.get_children():
+            if element.get_role() != push_button:
+                continue
+            if keyword not in element.get_name().lower():
+                continue
+                
+            if not element.do_action(0):  # Action par défaut (clic)
+                return False
+            if action != 'find':
+                return True
                 
+            # Attendre que la boîte de dialogue s'ouvre
+            # Entrer le texte à rechercher
+            for child in element.get_children():
+                if child.get_role() == Atspi.Role.ENTRY:
+                    child.set_text_contents(text)
+                    break
+                    
+            # Valider
+            for child in element.get_children():
+                if (child.get_role() == push_button and 
+                    'ok' in child.get_name().lower()):
+                    return bool(child.do_action(0))
+                    
         return False
         
     except Exception as e:
-        logger.error(f"Erreur lors de l'exécution de l'action {action} : {str(e)}")
-        return False 
\ No newline at end of file
+        logger.error("Erreur lors de l'exécution de l'action %s : %s", action, e)
+        return False 
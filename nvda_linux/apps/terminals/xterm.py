@@ -11,10 +11,12 @@ Gère l'interaction avec XTerm via AT-SPI, incluant :
 
 import os
 import logging
-from typing import Dict, Any, Optional, List, Tuple
+import functools
+from collections import deque
+from typing import Dict, Any, Callable, Optional, List, Tuple
 import gi
 gi.require_version('Atspi', '2.0')
-from gi.repository import Atspi
+from gi.repository import Atspi, GLib
 
 # Configuration du logger
 logger = logging.getLogger(__name__)
@@ -44,13 +46,63 @@ XTERM_ROLES = {
     'notification': Atspi.Role.NOTIFICATION
 }
 
+# Correspondance inverse rôle AT-SPI -> nom, évite l'appel get_role_name()
+_ROLE_NAMES = {role: name for name, role in XTERM_ROLES.items()}
+
+# Mot-clé recherché dans le nom du bouton associé à chaque action
+_ACTION_KEYWORDS = {
+    'copy': 'copy',
+    'paste': 'paste',
+    'select_all': 'select all',
+    'find': 'find',
+    'preferences': 'preferences',
+    'zoom_in': 'zoom in',
+    'zoom_out': 'zoom out',
+    'zoom_reset': 'zoom reset',
+    'fullscreen': 'fullscreen'
+}
+
+# Noms (en minuscules) sous lesquels XTerm s'enregistre auprès d'AT-SPI
+_XTERM_NAMES = frozenset({'xterm'})
+
+# Événements AT-SPI qui invalident les caches de l'arbre
+_INVALIDATING_EVENTS = (
+    'object:children-changed',
+    'object:state-changed:defunct'
+)
+
 # Variables globales
 _accessibility_manager = None
 _xterm_instance = None
+_terminal_node = None
+_action_index = None
+_event_listener = None
+
+def _on_tree_change(event: Atspi.Event) -> None:
+    """Invalide les caches quand l'arbre d'accessibilité de XTerm change."""
+    global _terminal_node, _action_index
+    
+    try:
+        if event.source.get_application() != _xterm_instance:
+            return
+    except Exception:
+        # Source inaccessible (objet détruit) : invalider par précaution
+        pass
+    _terminal_node = None
+    _action_index = None
+
+def _deregister_event_listener() -> None:
+    """Retire l'écouteur d'événements AT-SPI s'il est enregistré."""
+    global _event_listener
+    
+    if _event_listener is not None:
+        for event_type in _INVALIDATING_EVENTS:
+            _event_listener.deregister(event_type)
+        _event_listener = None
 
 def initialize() -> bool:
     """Initialise l'intégration avec XTerm."""
-    global _accessibility_manager, _xterm_instance
+    global _accessibility_manager, _xterm_instance, _terminal_node, _event_listener
     
     try:
         # Initialiser AT-SPI
@@ -62,6 +114,16 @@ def initialize() -> bool:
             logger.error("XTerm n'est pas en cours d'exécution")
             return False
             
+        # Mémoriser le nœud TERMINAL pour éviter de reparcourir l'arbre
+        _terminal_node = find_terminal_node(_xterm_instance)
+        
+        # Invalider les caches sur les changements de l'arbre, sans
+        # laisser derrière un écouteur d'une initialisation précédente
+        _deregister_event_listener()
+        _event_listener = Atspi.EventListener.new(_on_tree_change)
+        for event_type in _INVALIDATING_EVENTS:
+            _event_listener.register(event_type)
+        
         logger.info("Intégration XTerm initialisée avec succès")
         return True
         
@@ -71,9 +133,12 @@ def initialize() -> bool:
 
 def cleanup() -> None:
     """Nettoie les ressources utilisées par l'intégration."""
-    global _accessibility_manager, _xterm_instance
+    global _accessibility_manager, _xterm_instance, _terminal_node, _action_index
     
     try:
+        _deregister_event_listener()
+        _action_index = None
+        _terminal_node = None
         _xterm_instance = None
         _accessibility_manager = None
         logger.info("Intégration XTerm nettoyée")
@@ -84,10 +149,7 @@ def find_xterm_instance() -> Optional[Atspi.Accessible]:
     """Trouve l'instance de XTerm en cours d'exécution."""
     try:
         desktop = Atspi.get_desktop(0)
-        for app in desktop:
-            if app.get_name().lower() == 'xterm':
-                return app
-        return None
+        return next((app for app in desktop if app.get_name().lower() in _XTERM_NAMES), None)
     except Exception as e:
         logger.error(f"Erreur lors de la recherche de XTerm : {str(e)}")
         return None
@@ -96,175 +158,231 @@ def get_instance() -> Optional[Atspi.Accessible]:
     """Récupère l'instance de XTerm."""
     return _xterm_instance
 
+def _attr(attrs: Dict[str, str], key: str, cast: Callable[[str], Any] = str,
+          default: Any = '') -> Any:
+    """Lit un attribut AT-SPI converti, ou default s'il est absent ou invalide."""
+    value = attrs.get(key)
+    if not value:
+        return default
+    try:
+        return cast(value)
+    except ValueError:
+        return default
+
 def get_terminal_info() -> Dict[str, Any]:
     """Récupère les informations sur l'instance de XTerm."""
     if not _xterm_instance:
         return {}
         
     try:
-        return {
-            'name': _xterm_instance.get_name(),
-            'role': _xterm_instance.get_role_name(),
-            'version': _xterm_instance.get_attributes().get('version', ''),
-            'pid': _xterm_instance.get_process_id(),
-            'children': len(_xterm_instance.get_children()),
-            'rows': int(_xterm_instance.get_attributes().get('rows', '24')),
-            'columns': int(_xterm_instance.get_attributes().get('columns', '80')),
-            'font': _xterm_instance.get_attributes().get('font', ''),
-            'colors': _xterm_instance.get_attributes().get('colors', ''),
-            'encoding': _xterm_instance.get_attributes().get('encoding', ''),
-            'shell': _xterm_instance.get_attributes().get('shell', ''),
-            'working_dir': _xterm_instance.get_attributes().get('working_dir', '')
-        }
-    except Exception as e:
+        attrs = _xterm_instance.get_attributes()
+        name = _xterm_instance.get_name()
+        role = _xterm_instance.get_role()
+        pid = _xterm_instance.get_process_id()
+        children = _xterm_instance.get_child_count()
+    except GLib.Error as e:
         logger.error(f"Erreur lors de la récupération des informations XTerm : {str(e)}")
         return {}
+        
+    return {
+        'name': name,
+        'role': _ROLE_NAMES.get(role, ''),
+        'version': _attr(attrs, 'version'),
+        'pid': pid,
+        'children': children,
+        'rows': _attr(attrs, 'rows', int, 24),
+        'columns': _attr(attrs, 'columns', int, 80),
+        'font': _attr(attrs, 'font'),
+        'colors': _attr(attrs, 'colors'),
+        'encoding': _attr(attrs, 'encoding'),
+        'shell': _attr(attrs, 'shell'),
+        'working_dir': _attr(attrs, 'working_dir')
+    }
+
+def find_terminal_node(root: Atspi.Accessible) -> Optional[Atspi.Accessible]:
+    """Trouve le premier nœud TERMINAL sous root (parcours en largeur)."""
+    terminal_role = Atspi.Role.TERMINAL
+    queue = deque([root])
+    while queue:
+        element = queue.popleft()
+        if element.get_role() == terminal_role:
+            return element
+        queue.extend(element.get_children())
+    return None
+
+def _get_terminal_node() -> Optional[Atspi.Accessible]:
+    """Retourne le nœud TERMINAL mémorisé, en le recherchant si nécessaire."""
+    global _terminal_node
+    
+    if _terminal_node is None:
+        _terminal_node = find_terminal_node(_xterm_instance)
+    return _terminal_node
 
 def get_cursor_position() -> Tuple[int, int]:
     """Récupère la position du curseur."""
+    global _terminal_node
+    
     if not _xterm_instance:
         return (0, 0)
         
     try:
-        def find_cursor_position(element: Atspi.Accessible) -> Optional[Tuple[int, int]]:
-            if element.get_role() == Atspi.Role.TERMINAL:
-                line = int(element.get_attributes().get('cursor_line', '0'))
-                column = int(element.get_attributes().get('cursor_column', '0'))
-                return (line, column)
-            for child in element.get_children():
-                result = find_cursor_position(child)
-                if result:
-                    return result
-            return None
+        terminal = _get_terminal_node()
+        if terminal is None:
+            return (0, 0)
             
-        return find_cursor_position(_xterm_instance) or (0, 0)
+        attrs = terminal.get_attributes()
+        return (_attr(attrs, 'cursor_line', int, 0),
+                _attr(attrs, 'cursor_column', int, 0))
     except Exception as e:
+        # Le nœud mémorisé a pu disparaître : il sera recherché à nouveau
+        _terminal_node = None
         logger.error(f"Erreur lors de la récupération de la position du curseur : {str(e)}")
         return (0, 0)
 
 def get_selection() -> Tuple[Tuple[int, int], Tuple[int, int]]:
     """Récupère la sélection actuelle."""
+    global _terminal_node
+    
     if not _xterm_instance:
         return ((0, 0), (0, 0))
         
     try:
-        def find_selection(element: Atspi.Accessible) -> Optional[Tuple[Tuple[int, int], Tuple[int, int]]]:
-            if element.get_role() == Atspi.Role.TERMINAL:
-                start_line = int(element.get_attributes().get('selection_start_line', '0'))
-                start_column = int(element.get_attributes().get('selection_start_column', '0'))
-                end_line = int(element.get_attributes().get('selection_end_line', '0'))
-                end_column = int(element.get_attributes().get('selection_end_column', '0'))
-                return ((start_line, start_column), (end_line, end_column))
-            for child in element.get_children():
-                result = find_selection(child)
-                if result:
-                    return result
-            return None
+        terminal = _get_terminal_node()
+        if terminal is None:
+            return ((0, 0), (0, 0))
             
-        return find_selection(_xterm_instance) or ((0, 0), (0, 0))
+        attrs = terminal.get_attributes()
+        return ((_attr(attrs, 'selection_start_line', int, 0),
+                 _attr(attrs, 'selection_start_column', int, 0)),
+                (_attr(attrs, 'selection_end_line', int, 0),
+                 _attr(attrs, 'selection_end_column', int, 0)))
     except Exception as e:
+        # Le nœud mémorisé a pu disparaître : il sera recherché à nouveau
+        _terminal_node = None
         logger.error(f"Erreur lors de la récupération de la sélection : {str(e)}")
         return ((0, 0), (0, 0))
 
+@functools.lru_cache(maxsize=None)
+def _role_rule(roles: Tuple[Atspi.Role, ...]) -> Atspi.MatchRule:
+    """Construit une règle Collection qui retient les éléments de ces rôles."""
+    return Atspi.MatchRule.new(
+        Atspi.StateSet.new([]), Atspi.CollectionMatchType.ALL,
+        {}, Atspi.CollectionMatchType.ALL,
+        list(roles), Atspi.CollectionMatchType.ANY,
+        [], Atspi.CollectionMatchType.ALL,
+        False
+    )
+
+def _children_with_roles(root: Atspi.Accessible,
+                         roles: Tuple[Atspi.Role, ...]) -> List[Atspi.Accessible]:
+    """Retourne les enfants directs de root ayant l'un des rôles donnés.
+    
+    Utilise l'interface Collection (un seul appel D-Bus) si l'application
+    la fournit, sinon interroge le rôle de chaque enfant.
+    """
+    collection = root.get_collection_iface()
+    if collection is not None:
+        # get_matches() parcourt tout le sous-arbre (traverse est ignoré) :
+        # ne garder que les enfants directs, comme le repli ci-dessous
+        matches = collection.get_matches(
+            _role_rule(roles), Atspi.CollectionSortOrder.CANONICAL, 0, False
+        )
+        return [element for element in matches if element.get_parent() == root]
+    return [child for child in root.get_children() if child.get_role() in roles]
+
+def _build_action_index(root: Atspi.Accessible) -> Dict[str, Atspi.Accessible]:
+    """Associe chaque action au premier bouton dont le nom contient son mot-clé."""
+    index = {}
+    for element in _children_with_roles(root, (Atspi.Role.PUSH_BUTTON,)):
+        name = element.get_name().lower()
+        for action, keyword in _ACTION_KEYWORDS.items():
+            if keyword in name:
+                index.setdefault(action, element)
+    return index
+
+def _get_action_index() -> Dict[str, Atspi.Accessible]:
+    """Retourne l'index des boutons d'action, en le construisant si nécessaire."""
+    global _action_index
+    
+    if _action_index is None:
+        _action_index = _build_action_index(_xterm_instance)
+    return _action_index
+
+def _press_button(action: str, **kwargs) -> bool:
+    """Clique sur le bouton associé à l'action."""
+    button = _get_action_index().get(action)
+    return button.do_action(0) if button else False  # Action par défaut (clic)
+
+def _do_find(**kwargs) -> bool:
+    """Recherche du texte via la boîte de dialogue de recherche."""
+    text = kwargs.get('text', '')
+    if not text:
+        return False
+        
+    button = _get_action_index().get('find')
+    if button is None:
+        return False
+    if not button.do_action(0):  # Action par défaut (clic)
+        return False
+        
+    # Attendre que la boîte de dialogue s'ouvre
+    # Lire une seule fois le rôle des enfants directs du dialogue
+    entry_role = Atspi.Role.ENTRY
+    push_button = Atspi.Role.PUSH_BUTTON
+    widgets = [(child, child.get_role()) for child in button.get_children()]
+    
+    # Entrer le texte à rechercher
+    for child, role in widgets:
+        if role == entry_role:
+            child.set_text_contents(text)
+            break
+            
+    # Valider
+    for child, role in widgets:
+        if role == push_button and 'ok' in child.get_name().lower():
+            return child.do_action(0)
+    return False
+
+def _do_click(**kwargs) -> bool:
+    """Clique sur l'élément fourni."""
+    element = kwargs.get('element')
+    return element.do_action(0) if element else False  # Action par défaut (clic)
+
+def _do_focus(**kwargs) -> bool:
+    """Donne le focus à l'élément fourni."""
+    element = kwargs.get('element')
+    return element.do_action(1) if element else False  # Action par défaut (focus)
+
+# Table de dispatch des actions, les plus fréquentes en premier
+_ACTIONS = {
+    'copy': functools.partial(_press_button, 'copy'),
+    'paste': functools.partial(_press_button, 'paste'),
+    'click': _do_click,
+    'focus': _do_focus,
+    'select_all': functools.partial(_press_button, 'select_all'),
+    'find': _do_find,
+    'zoom_in': functools.partial(_press_button, 'zoom_in'),
+    'zoom_out': functools.partial(_press_button, 'zoom_out'),
+    'zoom_reset': functools.partial(_press_button, 'zoom_reset'),
+    'fullscreen': functools.partial(_press_button, 'fullscreen'),
+    'preferences': functools.partial(_press_button, 'preferences')
+}
+
 def execute_action(action: str, **kwargs) -> bool:
     """Exécute une action dans XTerm."""
+    global _action_index
+    
     if not _xterm_instance:
         return False
         
-    try:
-        if action == 'copy':
-            # Copier la sélection
-            for element in _xterm_instance.get_children():
-                if (element.get_role() == Atspi.Role.PUSH_BUTTON and 
-                    'copy' in element.get_name().lower()):
-                    return element.do_action(0)  # Action par défaut (clic)
-                    
-        elif action == 'paste':
-            # Coller le contenu du presse-papiers
-            for element in _xterm_instance.get_children():
-                if (element.get_role() == Atspi.Role.PUSH_BUTTON and 
-                    'paste' in element.get_name().lower()):
-                    return element.do_action(0)  # Action par défaut (clic)
-                    
-        elif action == 'select_all':
-            # Tout sélectionner
-            for element in _xterm_instance.get_children():
-                if (element.get_role() == Atspi.Role.PUSH_BUTTON and 
-                    'select all' in element.get_name().lower()):
-                    return element.do_action(0)  # Action par défaut (clic)
-                    
-        elif action == 'find':
-            # Rechercher du texte
-            text = kwargs.get('text', '')
-            if not text:
-                return False
-                
-            for element in _xterm_instance.get_children():
-                if (element.get_role() == Atspi.Role.PUSH_BUTTON and 
-                    'find' in element.get_name().lower()):
-                    if not element.do_action(0):  # Action par défaut (clic)
-                        return False
-                        
-                    # Attendre que la boîte de dialogue s'ouvre
-                    # Entrer le texte à rechercher
-                    for child in element.get_children():
-                        if child.get_role() == Atspi.Role.ENTRY:
-                            child.set_text_contents(text)
-                            break
-                            
-                    # Valider
-                    for child in element.get_children():
-                        if (child.get_role() == Atspi.Role.PUSH_BUTTON and 
-                            'ok' in child.get_name().lower()):
-                            return child.do_action(0)
-                            
-        elif action == 'preferences':
-            # Ouvrir les préférences
-            for element in _xterm_instance.get_children():
-                if (element.get_role() == Atspi.Role.PUSH_BUTTON and 
-                    'preferences' in element.get_name().lower()):
-                    return element.do_action(0)  # Action par défaut (clic)
-                    
-        elif action == 'zoom_in':
-            # Agrandir le texte
-            for element in _xterm_instance.get_children():
-                if (element.get_role() == Atspi.Role.PUSH_BUTTON and 
-                    'zoom in' in element.get_name().lower()):
-                    return element.do_action(0)  # Action par défaut (clic)
-                    
-        elif action == 'zoom_out':
-            # Réduire le texte
-            for element in _xterm_instance.get_children():
-                if (element.get_role() == Atspi.Role.PUSH_BUTTON and 
-                    'zoom out' in element.get_name().lower()):
-                    return element.do_action(0)  # Action par défaut (clic)
-                    
-        elif action == 'zoom_reset':
-            # Réinitialiser le zoom
-            for element in _xterm_instance.get_children():
-                if (element.get_role() == Atspi.Role.PUSH_BUTTON and 
-                    'zoom reset' in element.get_name().lower()):
-                    return element.do_action(0)  # Action par défaut (clic)
-                    
-        elif action == 'fullscreen':
-            # Passer en plein écran
-            for element in _xterm_instance.get_children():
-                if (element.get_role() == Atspi.Role.PUSH_BUTTON and 
-                    'fullscreen' in element.get_name().lower()):
-                    return element.do_action(0)  # Action par défaut (clic)
-                    
-        elif action == 'click':
-            element = kwargs.get('element')
-            if element:
-                return element.do_action(0)  # Action par défaut (clic)
-                
-        elif action == 'focus':
-            element = kwargs.get('element')
-            if element:
-                return element.do_action(1)  # Action par défaut (focus)
-                
+    handler = _ACTIONS.get(action)
+    if handler is None:
         return False
         
+    try:
+        return handler(**kwargs)
     except Exception as e:
+        # Un bouton indexé a pu disparaître : l'index sera reconstruit
+        _action_index = None
         logger.error(f"Erreur lors de l'exécution de l'action {action} : {str(e)}")
-        return False 
\ No newline at end of file
+        return False 
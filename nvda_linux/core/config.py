@@ -11,10 +11,11 @@ incluant les paramètres d'IA et d'accessibilité.
 
 import os
 import json
-import logging
+import functools
 import configparser
+import logging
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -129,79 +130,171 @@ DEFAULT_CONFIG = {
     }
 }
 
-# Instance du parser de configuration
-_config = configparser.ConfigParser()
+# Configuration courante, imbriquée comme DEFAULT_CONFIG
+_config: Dict[str, Dict[str, Any]] = {}
+
+# Configuration par défaut sérialisée une fois pour toutes
+_DEFAULT_JSON = json.dumps(DEFAULT_CONFIG, indent=4, ensure_ascii=False)
+
+def _copy_tree(node: Dict[str, Any]) -> Dict[str, Any]:
+    """Copie une section de configuration (sous-dictionnaires et listes compris)"""
+    return {
+        key: _copy_tree(value) if isinstance(value, dict)
+        else list(value) if isinstance(value, list)
+        else value
+        for key, value in node.items()
+    }
+
+def _fill_defaults(target: Dict[str, Any], defaults: Dict[str, Any]) -> bool:
+    """Complète target avec les valeurs par défaut absentes, retourne True si modifié"""
+    changed = False
+    for key, value in defaults.items():
+        if key not in target:
+            target[key] = _copy_tree(value) if isinstance(value, dict) else value
+            changed = True
+        elif isinstance(value, dict) and isinstance(target[key], dict):
+            changed = _fill_defaults(target[key], value) or changed
+    return changed
+
+def _parse_ini_value(raw: str, default: Any) -> Any:
+    """Convertit une valeur INI selon le type de sa valeur par défaut"""
+    try:
+        if isinstance(default, bool):
+            return raw.strip().lower() in ("1", "yes", "true", "on")
+        if isinstance(default, int):
+            return int(raw)
+        if isinstance(default, float):
+            return float(raw)
+    except ValueError:
+        return default
+    return raw
+
+def _convert_ini(config_path: str) -> Optional[Dict[str, Any]]:
+    """Convertit un ancien fichier ConfigParser (options "vision.enabled") en configuration imbriquée"""
+    parser = configparser.ConfigParser(interpolation=None)
+    try:
+        if not parser.read(config_path, encoding='utf-8'):
+            return None
+    except (configparser.Error, UnicodeDecodeError):
+        return None
+    
+    converted: Dict[str, Any] = {}
+    for section in parser.sections():
+        node = converted.setdefault(section, {})
+        defaults = DEFAULT_CONFIG.get(section, {})
+        for option, raw in parser.items(section):
+            *parents, key = option.split(".")
+            target, default = node, defaults
+            for parent in parents:
+                target = target.setdefault(parent, {})
+                default = default.get(parent, {}) if isinstance(default, dict) else {}
+            default = default.get(key) if isinstance(default, dict) else None
+            target[key] = _parse_ini_value(raw, default)
+    return converted
+
+def _recover(config_path: str) -> Tuple[Dict[str, Any], bool]:
+    """Remplace un fichier illisible : conversion INI si possible, sinon valeurs par défaut
+    
+    Retourne la configuration et True si l'ancien fichier a été mis de côté.
+    """
+    loaded = _convert_ini(config_path)
+    backup_path = f"{config_path}.bak"
+    try:
+        # L'ancien fichier est conservé à côté avant toute réécriture
+        os.replace(config_path, backup_path)
+        kept_aside = True
+    except OSError as e:
+        logger.error(f"Impossible de sauvegarder {config_path} dans {backup_path}: {str(e)}")
+        kept_aside = False
+    
+    if loaded is None:
+        logger.warning(
+            f"Configuration illisible dans {config_path}, valeurs par défaut utilisées "
+            f"(ancien fichier conservé dans {backup_path})"
+        )
+        return json.loads(_DEFAULT_JSON), kept_aside
+    
+    logger.warning(
+        f"Ancienne configuration INI convertie en JSON dans {config_path} "
+        f"(original conservé dans {backup_path})"
+    )
+    return loaded, kept_aside
 
 def initialize(config_path: Optional[str] = None) -> bool:
     """Initialise la configuration"""
-    try:
-        global _config
+    global _config
+    
+    if config_path and os.path.exists(config_path):
+        # Charge le fichier puis ne complète que les options manquantes
+        try:
+            with open(config_path, 'r', encoding='utf-8') as f:
+                loaded = json.load(f)
+        except OSError as e:
+            logger.error(f"Erreur lors de l'initialisation de la configuration: {str(e)}")
+            return False
+        except ValueError:
+            loaded = None
         
-        # Définit les valeurs par défaut
-        for section, options in DEFAULT_CONFIG.items():
-            if not _config.has_section(section):
-                _config.add_section(section)
-            for option, value in options.items():
-                if isinstance(value, dict):
-                    # Gère les sous-sections
-                    for sub_option, sub_value in value.items():
-                        _config.set(section, f"{option}.{sub_option}", str(sub_value))
-                else:
-                    _config.set(section, option, str(value))
+        writable = True
+        if isinstance(loaded, dict):
+            rewrite = False
+        else:
+            # Fichier d'une version précédente (ConfigParser) ou corrompu :
+            # il n'est réécrit que s'il a pu être mis de côté
+            loaded, writable = _recover(config_path)
+            rewrite = True
         
-        # Charge la configuration si un chemin est fourni
+        _config = loaded
+        if (_fill_defaults(_config, DEFAULT_CONFIG) or rewrite) and writable:
+            save(config_path)
+    else:
+        # Définit les valeurs par défaut depuis leur forme sérialisée
+        _config = json.loads(_DEFAULT_JSON)
         if config_path:
-            if os.path.exists(config_path):
-                _config.read(config_path)
-            else:
+            try:
                 # Crée le répertoire si nécessaire
-                os.makedirs(os.path.dirname(config_path), exist_ok=True)
+                config_dir = os.path.dirname(config_path)
+                if config_dir:
+                    os.makedirs(config_dir, exist_ok=True)
                 # Sauvegarde la configuration par défaut
-                with open(config_path, 'w') as f:
-                    _config.write(f)
-        
-        logger.info("Configuration initialisée avec succès")
-        return True
-    except Exception as e:
-        logger.error(f"Erreur lors de l'initialisation de la configuration: {str(e)}")
-        return False
+                with open(config_path, 'w', encoding='utf-8') as f:
+                    f.write(_DEFAULT_JSON)
+            except OSError as e:
+                _lookup.cache_clear()
+                logger.error(f"Erreur lors de l'initialisation de la configuration: {str(e)}")
+                return False
+    
+    _lookup.cache_clear()
+    logger.info("Configuration initialisée avec succès")
+    return True
+
+# Marqueur des options absentes dans le cache de lecture
+_MISSING = object()
+
+@functools.lru_cache(maxsize=256)
+def _lookup(section: str, option: str) -> Any:
+    """Parcourt le chemin pointé d'une option, _MISSING si elle est absente"""
+    value = _config.get(section)
+    for key in option.split("."):
+        if not isinstance(value, dict) or key not in value:
+            return _MISSING
+        value = value[key]
+    return value
 
 def get(section: str, option: str, default: Any = None) -> Any:
-    """Récupère une valeur de configuration"""
-    try:
-        if "." in option:
-            # Gère les options avec sous-sections
-            main_option, sub_option = option.split(".", 1)
-            value = _config.get(section, f"{main_option}.{sub_option}", fallback=str(default))
-        else:
-            value = _config.get(section, option, fallback=str(default))
-        
-        # Convertit la valeur au type approprié
-        if isinstance(default, bool):
-            return _config.getboolean(section, option, fallback=default)
-        elif isinstance(default, int):
-            return _config.getint(section, option, fallback=default)
-        elif isinstance(default, float):
-            return _config.getfloat(section, option, fallback=default)
-        else:
-            return value
-    except Exception as e:
-        logger.error(f"Erreur lors de la récupération de la configuration {section}.{option}: {str(e)}")
-        return default
+    """Récupère une valeur de configuration (ex. get("ai", "vision.enabled"))"""
+    value = _lookup(section, option)
+    return default if value is _MISSING else value
 
 def set(section: str, option: str, value: Any) -> bool:
     """Définit une valeur de configuration"""
     try:
-        if not _config.has_section(section):
-            _config.add_section(section)
-        
-        if "." in option:
-            # Gère les options avec sous-sections
-            main_option, sub_option = option.split(".", 1)
-            _config.set(section, f"{main_option}.{sub_option}", str(value))
-        else:
-            _config.set(section, option, str(value))
-        
+        *parents, key = option.split(".")
+        node = _config.setdefault(section, {})
+        for parent in parents:
+            node = node.setdefault(parent, {})
+        node[key] = value
+        _lookup.cache_clear()
         return True
     except Exception as e:
         logger.error(f"Erreur lors de la définition de la configuration {section}.{option}: {str(e)}")
@@ -210,8 +303,8 @@ def set(section: str, option: str, value: Any) -> bool:
 def save(config_path: str) -> bool:
     """Sauvegarde la configuration"""
     try:
-        with open(config_path, 'w') as f:
-            _config.write(f)
+        with open(config_path, 'w', encoding='utf-8') as f:
+            json.dump(_config, f, indent=4, ensure_ascii=False)
         logger.info(f"Configuration sauvegardée dans {config_path}")
         return True
     except Exception as e:
@@ -220,30 +313,14 @@ def save(config_path: str) -> bool:
 
 def get_all() -> Dict[str, Dict[str, Any]]:
     """Récupère toute la configuration"""
-    try:
-        config_dict = {}
-        for section in _config.sections():
-            config_dict[section] = {}
-            for option in _config.options(section):
-                if "." in option:
-                    # Gère les options avec sous-sections
-                    main_option, sub_option = option.split(".", 1)
-                    if main_option not in config_dict[section]:
-                        config_dict[section][main_option] = {}
-                    config_dict[section][main_option][sub_option] = get(section, option)
-                else:
-                    config_dict[section][option] = get(section, option)
-        return config_dict
-    except Exception as e:
-        logger.error(f"Erreur lors de la récupération de la configuration complète: {str(e)}")
-        return {}
+    return _copy_tree(_config)
 
 def reset() -> bool:
     """Réinitialise la configuration aux valeurs par défaut"""
     try:
         global _config
-        _config = configparser.ConfigParser()
+        _config = {}
         return initialize()
     except Exception as e:
         logger.error(f"Erreur lors de la réinitialisation de la configuration: {str(e)}")
-        return False 
\ No newline at end of file
+        return False
@@ -1,8 +1,26 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import os
 from setuptools import setup, find_packages
 
+# Compilation optionnelle de la couche de dispatch des terminaux avec mypyc.
+# Les modules restent importables en .py pour le développement ; activer avec
+# NVDA_LINUX_MYPYC=1. Un seul groupe est produit (une seule extension partagée).
+ext_modules = []
+if os.environ.get("NVDA_LINUX_MYPYC") == "1":
+    from mypyc.build import mypycify
+
+    ext_modules = mypycify(
+        [
+            # Seuls les modules compilés sont vérifiés, pas les paquets parents
+            "--follow-imports=silent",
+            "nvda_linux/apps/terminals/__init__.py",
+            "nvda_linux/apps/terminals/terminator.py",
+        ],
+        opt_level="3",
+    )
+
 setup(
     name="nvda_linux",
     version="0.1.0",
@@ -10,40 +28,9 @@ setup(
     author="NVDA-Linux Team",
     author_email="contact@nvda-linux.org",
     packages=find_packages(),
-    install_requires=[
-        "pyatspi>=2.46.0",
-        "speechd>=0.11.0",
-        "evdev>=1.6.1",
-        "python-brlapi>=0.8.0",
-        "PyGObject>=3.42.0",
-        "transformers>=4.30.0",
-        "torch>=2.0.0",
-        "opencv-python>=4.7.0",
-        "numpy>=1.24.0",
-        "pillow>=9.5.0",
-        "requests>=2.31.0",
-        "python-dotenv>=1.0.0",
-    ],
-    extras_require={
-        "dev": [
-            "pytest>=7.3.1",
-            "pytest-cov>=4.1.0",
-            "black>=23.3.0",
-            "flake8>=6.0.0",
-            "mypy>=1.3.0",
-        ],
-        "ai": [
-            "transformers>=4.30.0",
-            "torch>=2.0.0",
-            "opencv-python>=4.7.0",
-            "numpy>=1.24.0",
-            "pillow>=9.5.0",
-        ],
-        "android": [
-            "kivy>=2.2.1",
-            "buildozer>=1.5.0",
-        ],
-    },
+    ext_modules=ext_modules,
+    # Les dépendances et extras sont déclarés dans pyproject.toml ([project]),
+    # qui l'emporte sur install_requires/extras_require avec setuptools.build_meta
     entry_points={
         "console_scripts": [
             "nvda-linux=nvda_linux.main:main",
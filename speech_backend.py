@@ -7,16 +7,69 @@ Supporte plusieurs moteurs de synthèse vocale (espeak-ng, speech-dispatcher, et
 """
 
 import os
+import ctypes
 import logging
-import subprocess
 from typing import Optional, Dict, Any
 import config
 
+# Client SSIP fourni par l'extra "speech" (pip install nvda_linux[speech])
+try:
+    import speechd
+except ImportError:
+    speechd = None
+
 logger = logging.getLogger(__name__)
 
+# Constantes de l'API C de libespeak-ng (speak_lib.h)
+_ESPEAK_LIBRARY = 'libespeak-ng.so.1'
+_AUDIO_OUTPUT_PLAYBACK = 0
+_POS_CHARACTER = 1
+_ESPEAK_CHARS_UTF8 = 1
+_ESPEAK_RATE = 1
+_ESPEAK_VOLUME = 2
+_ESPEAK_PITCH = 3
+_EE_OK = 0
+
+class _EspeakVoice(ctypes.Structure):
+    """Structure espeak_VOICE renvoyée par espeak_ListVoices"""
+    _fields_ = [
+        ('name', ctypes.c_char_p),
+        ('languages', ctypes.c_char_p),
+        ('identifier', ctypes.c_char_p),
+        ('gender', ctypes.c_ubyte),
+        ('age', ctypes.c_ubyte),
+        ('variant', ctypes.c_ubyte),
+        ('xx1', ctypes.c_ubyte),
+        ('score', ctypes.c_int),
+        ('spare', ctypes.c_void_p)
+    ]
+
+def _list_espeak_voices(lib: ctypes.CDLL) -> frozenset:
+    """Construit l'ensemble exact des noms de voix acceptés par espeak_SetVoiceByName"""
+    voices = set()
+    entries = lib.espeak_ListVoices(None)
+    i = 0
+    while entries[i]:
+        voice = entries[i].contents
+        voices.add(voice.name.decode('utf-8'))
+        # Identifiant du type "roa/fr" : le nom de fichier "fr" est aussi accepté
+        if voice.identifier:
+            voices.add(voice.identifier.decode('utf-8').rsplit('/', 1)[-1])
+        # Le premier octet de la liste des langues est leur priorité
+        if voice.languages:
+            voices.add(voice.languages[1:].decode('utf-8'))
+        i += 1
+    return frozenset(voices)
+
+def _to_ssip(value: int) -> int:
+    """Convertit une valeur 0-100 vers l'échelle SSIP -100..100"""
+    return value * 2 - 100
+
 class SpeechEngine:
     """Classe de base pour les moteurs de synthèse vocale"""
     
+    __slots__ = ('initialized', 'current_voice', 'rate', 'pitch', 'volume')
+    
     def __init__(self):
         self.initialized = False
         self.current_voice = None
@@ -51,117 +104,166 @@ class SpeechEngine:
     def set_volume(self, volume: int) -> bool:
         """Change le volume"""
         raise NotImplementedError
+    
+    def configure(self, settings: Dict[str, Any]) -> None:
+        """Applique les préférences de la section 'voix' de la configuration"""
+        self.set_voice(settings.get('langue', 'fr'))
+        # La vitesse est exprimée en mots par minute, le taux interne vaut WPM / 2
+        self.set_rate(int(settings.get('vitesse', 100)) // 2)
+        self.set_pitch(int(settings.get('hauteur', 50)))
+        self.set_volume(int(settings.get('volume', 100)))
+    
+    def cleanup(self) -> None:
+        """Libère les ressources du moteur"""
+        self.initialized = False
 
 class EspeakEngine(SpeechEngine):
-    """Moteur de synthèse vocale utilisant espeak-ng"""
+    """Moteur de synthèse vocale utilisant libespeak-ng via ctypes"""
+    
+    __slots__ = ('_lib', '_available_voices')
     
     def __init__(self):
         super().__init__()
-        self.process: Optional[subprocess.Popen] = None
+        self._lib: Optional[ctypes.CDLL] = None
+        self._available_voices: frozenset = frozenset()
     
     def initialize(self) -> bool:
         try:
-            # Vérifie si espeak-ng est installé
-            subprocess.run(['which', 'espeak-ng'], check=True, capture_output=True)
-            self.initialized = True
-            logger.info("Moteur espeak-ng initialisé avec succès")
-            return True
-        except subprocess.CalledProcessError:
-            logger.error("espeak-ng n'est pas installé")
+            # Charge la bibliothèque une seule fois, sans lancer de processus
+            lib = ctypes.CDLL(_ESPEAK_LIBRARY)
+            lib.espeak_Initialize.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.c_char_p, ctypes.c_int]
+            lib.espeak_SetVoiceByName.argtypes = [ctypes.c_char_p]
+            lib.espeak_SetParameter.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.c_int]
+            lib.espeak_ListVoices.argtypes = [ctypes.c_void_p]
+            lib.espeak_ListVoices.restype = ctypes.POINTER(ctypes.POINTER(_EspeakVoice))
+            lib.espeak_Synth.argtypes = [
+                ctypes.c_void_p, ctypes.c_size_t, ctypes.c_uint, ctypes.c_int,
+                ctypes.c_uint, ctypes.c_uint, ctypes.c_void_p, ctypes.c_void_p
+            ]
+        except OSError:
+            logger.error("libespeak-ng n'est pas installé")
             return False
-        except Exception as e:
-            logger.error(f"Erreur lors de l'initialisation d'espeak-ng: {str(e)}")
+        
+        if lib.espeak_Initialize(_AUDIO_OUTPUT_PLAYBACK, 0, None, 0) < 0:
+            logger.error("Erreur lors de l'initialisation de libespeak-ng")
             return False
+        
+        self._lib = lib
+        self._available_voices = _list_espeak_voices(lib)
+        self.initialized = True
+        self._apply_parameters()
+        logger.info("Moteur espeak-ng initialisé avec succès")
+        return True
+    
+    def _apply_parameters(self) -> None:
+        """Transmet la vitesse, la hauteur et le volume courants à libespeak-ng"""
+        if self._lib is None:
+            return
+        # Conversion du taux (0-100) en WPM
+        self._lib.espeak_SetParameter(_ESPEAK_RATE, self.rate * 2, 0)
+        self._lib.espeak_SetParameter(_ESPEAK_PITCH, self.pitch, 0)
+        self._lib.espeak_SetParameter(_ESPEAK_VOLUME, self.volume, 0)
     
     def speak(self, text: str) -> bool:
         if not self.initialized:
             logger.error("Le moteur n'est pas initialisé")
             return False
         
-        try:
-            # Arrête toute synthèse en cours
-            self.stop()
-            
-            # Construit la commande espeak-ng
-            cmd = [
-                'espeak-ng',
-                '-v', self.current_voice or 'fr',
-                '-s', str(self.rate * 2),  # Conversion du taux (0-100) en WPM
-                '-p', str(self.pitch),
-                '-a', str(self.volume),
-                text
-            ]
-            
-            # Lance la synthèse
-            self.process = subprocess.Popen(cmd)
-            return True
-        except Exception as e:
-            logger.error(f"Erreur lors de la synthèse vocale: {str(e)}")
+        # Arrête toute synthèse en cours
+        self.stop()
+        
+        # La lecture est asynchrone : libespeak-ng joue l'audio dans son propre thread
+        data = text.encode('utf-8') + b'\0'
+        result = self._lib.espeak_Synth(
+            data, len(data), 0, _POS_CHARACTER, 0, _ESPEAK_CHARS_UTF8, None, None
+        )
+        if result != _EE_OK:
+            logger.error("Erreur lors de la synthèse vocale: code %s", result)
             return False
+        return True
     
     def stop(self) -> bool:
-        if self.process:
-            try:
-                self.process.terminate()
-                self.process.wait(timeout=1)
-                self.process = None
-                return True
-            except Exception as e:
-                logger.error(f"Erreur lors de l'arrêt de la synthèse: {str(e)}")
-                return False
+        if self._lib is None:
+            return True
+        if self._lib.espeak_Cancel() != _EE_OK:
+            logger.error("Erreur lors de l'arrêt de la synthèse")
+            return False
         return True
     
     def set_voice(self, voice: str) -> bool:
-        try:
-            # Vérifie si la voix existe
-            result = subprocess.run(
-                ['espeak-ng', '--voices=' + voice],
-                capture_output=True,
-                text=True
-            )
-            if voice in result.stdout:
-                self.current_voice = voice
-                return True
-            logger.error(f"Voix '{voice}' non trouvée")
+        if self._lib is None:
+            logger.error("Le moteur n'est pas initialisé")
             return False
-        except Exception as e:
-            logger.error(f"Erreur lors du changement de voix: {str(e)}")
+        # Correspondance exacte avec les noms, identifiants et langues connus
+        if voice not in self._available_voices:
+            logger.error("Voix '%s' non trouvée", voice)
             return False
+        if self._lib.espeak_SetVoiceByName(voice.encode('utf-8')) != _EE_OK:
+            logger.error("Erreur lors du changement de voix: %s", voice)
+            return False
+        self.current_voice = voice
+        self._apply_parameters()
+        return True
     
     def set_rate(self, rate: int) -> bool:
         if 0 <= rate <= 100:
             self.rate = rate
+            self._apply_parameters()
             return True
         return False
     
     def set_pitch(self, pitch: int) -> bool:
         if 0 <= pitch <= 100:
             self.pitch = pitch
+            self._apply_parameters()
             return True
         return False
     
     def set_volume(self, volume: int) -> bool:
         if 0 <= volume <= 100:
             self.volume = volume
+            self._apply_parameters()
             return True
         return False
+    
+    def cleanup(self) -> None:
+        """Libère les ressources de libespeak-ng"""
+        if self._lib is not None:
+            self._lib.espeak_Terminate()
+            self._lib = None
+        self.initialized = False
 
 class SpeechDispatcherEngine(SpeechEngine):
     """Moteur de synthèse vocale utilisant speech-dispatcher"""
     
+    __slots__ = ('client', '_available_voices')
+    
+    def __init__(self):
+        super().__init__()
+        self.client = None
+        self._available_voices: frozenset = frozenset()
+    
     def initialize(self) -> bool:
-        try:
-            # Vérifie si speech-dispatcher est installé
-            subprocess.run(['which', 'spd-say'], check=True, capture_output=True)
-            self.initialized = True
-            logger.info("Moteur speech-dispatcher initialisé avec succès")
-            return True
-        except subprocess.CalledProcessError:
-            logger.error("speech-dispatcher n'est pas installé")
+        if speechd is None:
+            logger.error("speechd n'est pas installé, installez l'extra nvda_linux[speech]")
             return False
+        
+        try:
+            # Connexion SSIP unique, réutilisée pour toute la durée du processus
+            self.client = speechd.SSIPClient('uniaccess')
+            # Liste des langues lue une seule fois : set_voice n'interroge plus le serveur
+            languages = set()
+            for _, language, _ in self.client.list_synthesis_voices():
+                languages.add(language)
+                languages.add(language.split('-')[0])
+            self._available_voices = frozenset(languages)
         except Exception as e:
-            logger.error(f"Erreur lors de l'initialisation de speech-dispatcher: {str(e)}")
+            logger.error("Erreur lors de l'initialisation de speech-dispatcher: %s", e)
             return False
+        
+        self.initialized = True
+        logger.info("Moteur speech-dispatcher initialisé avec succès")
+        return True
     
     def speak(self, text: str) -> bool:
         if not self.initialized:
@@ -170,101 +272,105 @@ class SpeechDispatcherEngine(SpeechEngine):
         
         try:
             # Arrête toute synthèse en cours
-            self.stop()
-            
-            # Construit la commande spd-say
-            cmd = [
-                'spd-say',
-                '-t', self.current_voice or 'fr',
-                '-r', str(self.rate),
-                '-p', str(self.pitch),
-                '-i', str(self.volume),
-                text
-            ]
-            
-            # Lance la synthèse
-            self.process = subprocess.Popen(cmd)
+            self.client.cancel()
+            self.client.speak(text)
             return True
         except Exception as e:
-            logger.error(f"Erreur lors de la synthèse vocale: {str(e)}")
+            logger.error("Erreur lors de la synthèse vocale: %s", e)
             return False
     
     def stop(self) -> bool:
+        if self.client is None:
+            return True
         try:
-            subprocess.run(['spd-say', '--stop'], check=True)
+            self.client.cancel()
             return True
         except Exception as e:
-            logger.error(f"Erreur lors de l'arrêt de la synthèse: {str(e)}")
+            logger.error("Erreur lors de l'arrêt de la synthèse: %s", e)
             return False
     
     def set_voice(self, voice: str) -> bool:
-        try:
-            # Vérifie si la voix existe
-            result = subprocess.run(
-                ['spd-say', '--list-voices'],
-                capture_output=True,
-                text=True
-            )
-            if voice in result.stdout:
-                self.current_voice = voice
-                return True
-            logger.error(f"Voix '{voice}' non trouvée")
+        if self.client is None:
+            logger.error("Le moteur n'est pas initialisé")
             return False
+        if voice not in self._available_voices:
+            logger.error("Voix '%s' non trouvée", voice)
+            return False
+        try:
+            self.client.set_language(voice)
+            self.current_voice = voice
+            return True
         except Exception as e:
-            logger.error(f"Erreur lors du changement de voix: {str(e)}")
+            logger.error("Erreur lors du changement de voix: %s", e)
             return False
     
     def set_rate(self, rate: int) -> bool:
         if 0 <= rate <= 100:
             self.rate = rate
+            if self.client is not None:
+                self.client.set_rate(_to_ssip(rate))
             return True
         return False
     
     def set_pitch(self, pitch: int) -> bool:
         if 0 <= pitch <= 100:
             self.pitch = pitch
+            if self.client is not None:
+                self.client.set_pitch(_to_ssip(pitch))
             return True
         return False
     
     def set_volume(self, volume: int) -> bool:
         if 0 <= volume <= 100:
             self.volume = volume
+            if self.client is not None:
+                self.client.set_volume(_to_ssip(volume))
             return True
         return False
+    
+    def cleanup(self) -> None:
+        """Ferme la connexion à speech-dispatcher"""
+        if self.client is not None:
+            self.client.close()
+            self.client = None
+        self.initialized = False
+
+# Moteurs disponibles, indexés par le nom utilisé dans la configuration
+_ENGINES = {
+    'espeak': EspeakEngine,
+    'speech-dispatcher': SpeechDispatcherEngine
+}
 
 # Instance globale du moteur de synthèse vocale
 _speech_engine: Optional[SpeechEngine] = None
 
-def initialize() -> bool:
+def initialize(speech_config: Optional[Dict[str, Any]] = None) -> bool:
     """Initialise le moteur de synthèse vocale"""
     global _speech_engine
     
     try:
-        # Récupère la configuration
-        engine_type = config.get_config('speech', 'engine', 'espeak')
+        # Récupère la section 'voix' de la configuration en une seule lecture
+        if speech_config is None:
+            speech_config = config.get_section('voix')
+        engine_type = speech_config.get('moteur', 'espeak')
         
         # Crée l'instance appropriée
-        if engine_type == 'espeak':
-            _speech_engine = EspeakEngine()
-        elif engine_type == 'speech-dispatcher':
-            _speech_engine = SpeechDispatcherEngine()
-        else:
-            logger.error(f"Moteur de synthèse vocale inconnu: {engine_type}")
+        engine_class = _ENGINES.get(engine_type)
+        if engine_class is None:
+            logger.error("Moteur de synthèse vocale inconnu: %s", engine_type)
             return False
+        _speech_engine = engine_class()
         
         # Initialise le moteur
         if not _speech_engine.initialize():
             return False
         
         # Configure le moteur selon les préférences
-        _speech_engine.set_voice(config.get_config('speech', 'voice', 'fr'))
-        _speech_engine.set_rate(int(config.get_config('speech', 'rate', 50)))
-        _speech_engine.set_pitch(int(config.get_config('speech', 'pitch', 50)))
-        _speech_engine.set_volume(int(config.get_config('speech', 'volume', 100)))
+        _speech_engine.configure(speech_config)
         
         return True
     except Exception as e:
-        logger.error(f"Erreur lors de l'initialisation de la synthèse vocale: {str(e)}")
+        logger.error("Erreur lors de l'initialisation de la synthèse vocale: %s", e)
         return False
 
 def say(text: str) -> bool:
@@ -292,4 +398,5 @@ def cleanup() -> None:
     
     if _speech_engine:
         _speech_engine.stop()
+        _speech_engine.cleanup()
         _speech_engine = None 
\ No newline at end of file
@@ -8,16 +8,18 @@ Teste les fonctionnalités d'accessibilité (contraste, raccourcis, etc.)
 
 import pytest
 from unittest.mock import patch, MagicMock
-import sys
-import os
+import statistics
 from pathlib import Path
-
-# Ajouter le répertoire parent au PYTHONPATH
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+from time import perf_counter_ns
 
 from nvda_linux.accessibility import contrast, shortcuts, braille, magnifier
 
+# Budget par appel pour test_performance (10 ms, soit 1 s pour 100 itérations)
+MAX_CALL_NS = 10_000_000
+
 class MockContrast:
+    __slots__ = ('initialized', 'contrast_ratio', 'last_foreground', 'last_background')
+    
     def __init__(self):
         self.initialized = False
         self.contrast_ratio = 1.0
@@ -50,6 +52,8 @@ class MockContrast:
         return False
 
 class MockShortcuts:
+    __slots__ = ('initialized', 'shortcuts', 'last_shortcut')
+    
     def __init__(self):
         self.initialized = False
         self.shortcuts = {}
@@ -83,6 +87,8 @@ class MockShortcuts:
         return False
 
 class MockBraille:
+    __slots__ = ('initialized', 'connected', 'last_text')
+    
     def __init__(self):
         self.initialized = False
         self.connected = False
@@ -114,6 +120,8 @@ class MockBraille:
         return True
 
 class MockMagnifier:
+    __slots__ = ('initialized', 'enabled', 'zoom_level', 'last_region')
+    
     def __init__(self):
         self.initialized = False
         self.enabled = False
@@ -205,53 +213,44 @@ def test_shortcuts_initialization(mock_shortcuts):
         assert shortcuts.cleanup()
         assert not mock_shortcuts.initialized
 
-def test_shortcut_registration(mock_shortcuts):
-    """Test l'enregistrement des raccourcis"""
-    with patch('nvda_linux.accessibility.shortcuts._shortcuts', mock_shortcuts):
+@pytest.fixture(scope="module")
+def active_shortcuts():
+    """Fixture fournissant une gestion des raccourcis initialisée une seule fois par module"""
+    mock = MockShortcuts()
+    with patch('nvda_linux.accessibility.shortcuts._shortcuts', mock):
         shortcuts.initialize()
-        
-        # Fonction de test
-        def test_callback():
-            pass
-        
-        # Enregistrer des raccourcis
-        assert shortcuts.register_shortcut("Ctrl+A", test_callback, "Sélectionner tout")
-        assert shortcuts.register_shortcut("Ctrl+C", test_callback, "Copier")
-        
-        # Vérifier l'enregistrement
-        assert "Ctrl+A" in mock_shortcuts.shortcuts
-        assert "Ctrl+C" in mock_shortcuts.shortcuts
-        
-        # Désenregistrer un raccourci
-        assert shortcuts.unregister_shortcut("Ctrl+A")
-        assert "Ctrl+A" not in mock_shortcuts.shortcuts
-        
+        yield mock
         shortcuts.cleanup()
 
-def test_shortcut_triggering(mock_shortcuts):
-    """Test le déclenchement des raccourcis"""
-    with patch('nvda_linux.accessibility.shortcuts._shortcuts', mock_shortcuts):
-        shortcuts.initialize()
-        
-        # Variable pour suivre l'appel
-        called = False
-        
-        def test_callback():
-            nonlocal called
-            called = True
-        
-        # Enregistrer un raccourci
-        shortcuts.register_shortcut("Ctrl+Space", test_callback, "Test")
-        
-        # Déclencher le raccourci
-        assert shortcuts.trigger_shortcut("Ctrl+Space")
-        assert called
-        assert mock_shortcuts.last_shortcut == "Ctrl+Space"
-        
-        # Test avec un raccourci non enregistré
-        assert not shortcuts.trigger_shortcut("Invalid")
-        
-        shortcuts.cleanup()
+@pytest.mark.parametrize("key,description", [
+    ("Ctrl+A", "Sélectionner tout"),
+    ("Ctrl+C", "Copier"),
+    ("Ctrl+Space", "Test")
+])
+def test_shortcut(active_shortcuts, key, description):
+    """Test l'enregistrement, le déclenchement et le retrait d'un raccourci"""
+    # Variable pour suivre l'appel
+    called = False
+    
+    def test_callback():
+        nonlocal called
+        called = True
+    
+    # Enregistrer le raccourci
+    assert shortcuts.register_shortcut(key, test_callback, description)
+    assert active_shortcuts.shortcuts[key] == (test_callback, description)
+    
+    # Déclencher le raccourci
+    assert shortcuts.trigger_shortcut(key)
+    assert called
+    assert active_shortcuts.last_shortcut == key
+    
+    # Désenregistrer le raccourci
+    assert shortcuts.unregister_shortcut(key)
+    assert key not in active_shortcuts.shortcuts
+    
+    # Test avec un raccourci non enregistré
+    assert not shortcuts.trigger_shortcut(key)
 
 def test_braille_initialization(mock_braille):
     """Test l'initialisation de l'affichage braille"""
@@ -361,28 +360,29 @@ def test_performance(mock_contrast, mock_shortcuts):
         contrast.initialize()
         shortcuts.initialize()
         
-        import time
-        
         # Test de performance du calcul de contraste
-        start_time = time.time()
+        contrast_timings = []
         for _ in range(100):  # 100 itérations
+            start = perf_counter_ns()
             contrast.compute_contrast_ratio((0, 0, 0), (255, 255, 255))
-        end_time = time.time()
-        contrast_duration = end_time - start_time
+            contrast_timings.append(perf_counter_ns() - start)
         
         # Test de performance des raccourcis
         def dummy_callback():
             pass
         
-        start_time = time.time()
+        shortcuts_timings = []
         for i in range(100):  # 100 itérations
+            start = perf_counter_ns()
             shortcuts.register_shortcut(f"Ctrl+{i}", dummy_callback, f"Test {i}")
-        end_time = time.time()
-        shortcuts_duration = end_time - start_time
-        
-        # Vérifier que les temps d'exécution sont raisonnables
-        assert contrast_duration < 1.0  # Moins d'une seconde pour 100 itérations
-        assert shortcuts_duration < 1.0  # Moins d'une seconde pour 100 itérations
+            shortcuts_timings.append(perf_counter_ns() - start)
+        
+        # La médiane résiste aux pics ponctuels (ordonnanceur, ramasse-miettes)
+        assert statistics.median(contrast_timings) < MAX_CALL_NS
+        assert statistics.median(shortcuts_timings) < MAX_CALL_NS
+        # Aucun appel isolé ne doit dépasser une seconde
+        assert max(contrast_timings) < 100 * MAX_CALL_NS
+        assert max(shortcuts_timings) < 100 * MAX_CALL_NS
         
         contrast.cleanup()
         shortcuts.cleanup() 
\ No newline at end of file
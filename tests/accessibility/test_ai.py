@@ -6,129 +6,62 @@ Tests pour l'IA et la reconnaissance d'image
 Teste les fonctionnalités d'IA, OCR et description d'interface
 """
 
+import copy
 import pytest
-from unittest.mock import patch, MagicMock
-import sys
-import os
+from contextlib import ExitStack
+from timeit import Timer
 from pathlib import Path
 import numpy as np
 from PIL import Image
 
-# Ajouter le répertoire parent au PYTHONPATH
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
-
 from nvda_linux.ai import recognition, ocr, description
+from ..helpers import swap_attr, MockImageRecognition, MockOCR, MockInterfaceDescription
 
-class MockImageRecognition:
-    def __init__(self):
-        self.initialized = False
-        self.models_loaded = {}
-        self.last_image = None
-        self.last_results = None
-        
-    def initialize(self):
-        self.initialized = True
-        return True
-        
-    def cleanup(self):
-        self.initialized = False
-        self.models_loaded = {}
-        return True
-        
-    def load_model(self, model_name):
-        self.models_loaded[model_name] = True
-        return True
-        
-    def recognize_objects(self, image):
-        self.last_image = image
-        # Simuler des résultats de reconnaissance
-        self.last_results = [
-            {'label': 'person', 'confidence': 0.95, 'box': [100, 100, 200, 300]},
-            {'label': 'chair', 'confidence': 0.85, 'box': [300, 200, 400, 400]}
-        ]
-        return self.last_results
-        
-    def estimate_depth(self, image):
-        self.last_image = image
-        # Simuler une carte de profondeur
-        return np.zeros((100, 100), dtype=np.float32)
+# Cas des tests paramétrés (tuples immuables partagés)
+_OCR_LANGUAGES = ('fr', 'en')
+_MODELS = ('object_detection', 'depth_estimation', 'pose_estimation', 'face_detection')
 
-class MockOCR:
-    def __init__(self):
-        self.initialized = False
-        self.languages = ['fr', 'en']
-        self.last_image = None
-        self.last_text = None
-        
-    def initialize(self):
-        self.initialized = True
-        return True
-        
-    def cleanup(self):
-        self.initialized = False
-        return True
-        
-    def recognize_text(self, image, language='fr'):
-        self.last_image = image
-        self.last_text = "Texte de test"
-        return self.last_text
-        
-    def get_available_languages(self):
-        return self.languages
+# Pixels blancs partagés en lecture seule par l'image de test
+_IMAGE_BUFFER = np.full((100, 100, 3), 255, dtype=np.uint8)
+_IMAGE_BUFFER.setflags(write=False)
 
-class MockInterfaceDescription:
-    def __init__(self):
-        self.initialized = False
-        self.last_element = None
-        self.last_description = None
-        
-    def initialize(self):
-        self.initialized = True
-        return True
-        
-    def cleanup(self):
-        self.initialized = False
-        return True
-        
-    def describe_element(self, element):
-        self.last_element = element
-        self.last_description = "Description de test"
-        return self.last_description
-        
-    def describe_interface(self, elements):
-        return "Description de l'interface de test"
+# Prototypes construits une seule fois, copiés par les fixtures
+_PROTO_IMAGE_RECOGNITION = MockImageRecognition()
+_PROTO_OCR = MockOCR()
+_PROTO_INTERFACE_DESCRIPTION = MockInterfaceDescription()
 
 @pytest.fixture
 def mock_image_recognition():
     """Fixture fournissant un mock de reconnaissance d'image"""
-    return MockImageRecognition()
+    return copy.deepcopy(_PROTO_IMAGE_RECOGNITION)
 
 @pytest.fixture
 def mock_ocr():
     """Fixture fournissant un mock d'OCR"""
-    return MockOCR()
+    return copy.copy(_PROTO_OCR)
 
 @pytest.fixture
 def mock_interface_description():
     """Fixture fournissant un mock de description d'interface"""
-    return MockInterfaceDescription()
+    return copy.copy(_PROTO_INTERFACE_DESCRIPTION)
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def test_image():
     """Fixture fournissant une image de test"""
-    return Image.new('RGB', (100, 100), color='white')
+    return Image.fromarray(_IMAGE_BUFFER)
 
-def test_image_recognition_initialization(mock_image_recognition):
-    """Test l'initialisation de la reconnaissance d'image"""
-    with patch('nvda_linux.ai.recognition._recognition', mock_image_recognition):
-        assert recognition.initialize()
-        assert mock_image_recognition.initialized
-        assert recognition.cleanup()
-        assert not mock_image_recognition.initialized
+@pytest.fixture
+def patched_ai_modules(mock_image_recognition, mock_ocr, mock_interface_description):
+    """Fixture remplaçant les trois moteurs d'IA par leurs mocks en une seule pile"""
+    with ExitStack() as stack:
+        stack.enter_context(swap_attr(recognition, '_recognition', mock_image_recognition))
+        stack.enter_context(swap_attr(ocr, '_ocr', mock_ocr))
+        stack.enter_context(swap_attr(description, '_description', mock_interface_description))
+        yield mock_image_recognition, mock_ocr, mock_interface_description
 
 def test_object_recognition(mock_image_recognition, test_image):
     """Test la reconnaissance d'objets"""
-    with patch('nvda_linux.ai.recognition._recognition', mock_image_recognition):
+    with swap_attr(recognition, '_recognition', mock_image_recognition):
         recognition.initialize()
         
         # Charger le modèle
@@ -146,7 +79,7 @@ def test_object_recognition(mock_image_recognition, test_image):
 
 def test_depth_estimation(mock_image_recognition, test_image):
     """Test l'estimation de profondeur"""
-    with patch('nvda_linux.ai.recognition._recognition', mock_image_recognition):
+    with swap_attr(recognition, '_recognition', mock_image_recognition):
         recognition.initialize()
         
         # Charger le modèle
@@ -160,17 +93,9 @@ def test_depth_estimation(mock_image_recognition, test_image):
         
         recognition.cleanup()
 
-def test_ocr_initialization(mock_ocr):
-    """Test l'initialisation de l'OCR"""
-    with patch('nvda_linux.ai.ocr._ocr', mock_ocr):
-        assert ocr.initialize()
-        assert mock_ocr.initialized
-        assert ocr.cleanup()
-        assert not mock_ocr.initialized
-
 def test_text_recognition(mock_ocr, test_image):
     """Test la reconnaissance de texte"""
-    with patch('nvda_linux.ai.ocr._ocr', mock_ocr):
+    with swap_attr(ocr, '_ocr', mock_ocr):
         ocr.initialize()
         
         # Reconnaître le texte
@@ -178,24 +103,23 @@ def test_text_recognition(mock_ocr, test_image):
         assert text is not None
         assert isinstance(text, str)
         
-        # Test avec différentes langues
-        for language in mock_ocr.languages:
-            text = ocr.recognize_text(test_image, language=language)
-            assert text is not None
-        
         ocr.cleanup()
 
-def test_interface_description_initialization(mock_interface_description):
-    """Test l'initialisation de la description d'interface"""
-    with patch('nvda_linux.ai.description._description', mock_interface_description):
-        assert description.initialize()
-        assert mock_interface_description.initialized
-        assert description.cleanup()
-        assert not mock_interface_description.initialized
+@pytest.mark.parametrize("language", _OCR_LANGUAGES)
+def test_text_recognition_language(mock_ocr, test_image, language):
+    """Test la reconnaissance de texte dans chaque langue disponible"""
+    with swap_attr(ocr, '_ocr', mock_ocr):
+        ocr.initialize()
+        
+        assert language in mock_ocr.languages
+        text = ocr.recognize_text(test_image, language=language)
+        assert text is not None
+        
+        ocr.cleanup()
 
 def test_element_description(mock_interface_description):
     """Test la description d'éléments d'interface"""
-    with patch('nvda_linux.ai.description._description', mock_interface_description):
+    with swap_attr(description, '_description', mock_interface_description):
         description.initialize()
         
         # Créer un élément de test
@@ -214,7 +138,7 @@ def test_element_description(mock_interface_description):
 
 def test_interface_description(mock_interface_description):
     """Test la description d'une interface complète"""
-    with patch('nvda_linux.ai.description._description', mock_interface_description):
+    with swap_attr(description, '_description', mock_interface_description):
         description.initialize()
         
         # Créer une interface de test
@@ -231,80 +155,61 @@ def test_interface_description(mock_interface_description):
         
         description.cleanup()
 
-def test_error_handling(mock_image_recognition, mock_ocr, mock_interface_description):
+def test_error_handling(patched_ai_modules):
     """Test la gestion des erreurs"""
-    with patch('nvda_linux.ai.recognition._recognition', mock_image_recognition), \
-         patch('nvda_linux.ai.ocr._ocr', mock_ocr), \
-         patch('nvda_linux.ai.description._description', mock_interface_description):
-        
-        # Test avec des systèmes non initialisés
-        mock_image_recognition.initialized = False
-        mock_ocr.initialized = False
-        mock_interface_description.initialized = False
-        
-        assert not recognition.recognize_objects(None)
-        assert not ocr.recognize_text(None)
-        assert not description.describe_element(None)
-        
-        # Test avec des entrées invalides
-        recognition.initialize()
-        ocr.initialize()
-        description.initialize()
-        
-        assert not recognition.recognize_objects("invalid")
-        assert not ocr.recognize_text("invalid")
-        assert not description.describe_element("invalid")
-        
-        recognition.cleanup()
-        ocr.cleanup()
-        description.cleanup()
-
-def test_model_management(mock_image_recognition):
+    mock_image_recognition, mock_ocr, mock_interface_description = patched_ai_modules
+    
+    # Test avec des systèmes non initialisés
+    mock_image_recognition.initialized = False
+    mock_ocr.initialized = False
+    mock_interface_description.initialized = False
+    
+    assert not recognition.recognize_objects(None)
+    assert not ocr.recognize_text(None)
+    assert not description.describe_element(None)
+    
+    # Test avec des entrées invalides
+    recognition.initialize()
+    ocr.initialize()
+    description.initialize()
+    
+    assert not recognition.recognize_objects("invalid")
+    assert not ocr.recognize_text("invalid")
+    assert not description.describe_element("invalid")
+    
+    recognition.cleanup()
+    ocr.cleanup()
+    description.cleanup()
+
+@pytest.mark.parametrize("model", _MODELS)
+def test_model_management(mock_image_recognition, model):
     """Test la gestion des modèles"""
-    with patch('nvda_linux.ai.recognition._recognition', mock_image_recognition):
+    with swap_attr(recognition, '_recognition', mock_image_recognition):
         recognition.initialize()
         
-        # Test de chargement de différents modèles
-        models = [
-            'object_detection',
-            'depth_estimation',
-            'pose_estimation',
-            'face_detection'
-        ]
-        
-        for model in models:
-            assert recognition.load_model(model)
-            assert model in mock_image_recognition.models_loaded
+        # Test de chargement du modèle
+        assert recognition.load_model(model)
+        assert model in mock_image_recognition.models_loaded
         
         recognition.cleanup()
 
+@pytest.mark.benchmark
 def test_performance(mock_image_recognition, mock_ocr, test_image):
     """Test les performances"""
-    with patch('nvda_linux.ai.recognition._recognition', mock_image_recognition), \
-         patch('nvda_linux.ai.ocr._ocr', mock_ocr):
+    with swap_attr(recognition, '_recognition', mock_image_recognition), \
+         swap_attr(ocr, '_ocr', mock_ocr):
         
         recognition.initialize()
         ocr.initialize()
         
-        import time
-        
         # Test de performance de la reconnaissance d'objets
-        start_time = time.time()
-        for _ in range(10):  # 10 itérations
-            recognition.recognize_objects(test_image)
-        end_time = time.time()
-        recognition_duration = end_time - start_time
+        # (autorange calibre lui-même le nombre d'itérations)
+        count, duration = Timer(lambda: recognition.recognize_objects(test_image)).autorange()
+        assert duration / count < 0.5  # Moins de 500 ms par appel
         
         # Test de performance de l'OCR
-        start_time = time.time()
-        for _ in range(10):  # 10 itérations
-            ocr.recognize_text(test_image)
-        end_time = time.time()
-        ocr_duration = end_time - start_time
-        
-        # Vérifier que les temps d'exécution sont raisonnables
-        assert recognition_duration < 5.0  # Moins de 5 secondes pour 10 itérations
-        assert ocr_duration < 5.0  # Moins de 5 secondes pour 10 itérations
+        count, duration = Timer(lambda: ocr.recognize_text(test_image)).autorange()
+        assert duration / count < 0.5  # Moins de 500 ms par appel
         
         recognition.cleanup()
         ocr.cleanup() 
\ No newline at end of file
@@ -6,54 +6,22 @@ Tests pour le support haptique
 Teste les fonctionnalités de retour tactile
 """
 
+import copy
 import pytest
-from unittest.mock import patch, MagicMock
-import sys
-import os
+from timeit import Timer
 from pathlib import Path
 
-# Ajouter le répertoire parent au PYTHONPATH
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
-
 from nvda_linux.haptics import controller, feedback
+from ..helpers import swap_attr, MockHapticController
 
-class MockHapticController:
-    def __init__(self):
-        self.connected = False
-        self.vibration_active = False
-        self.intensity = 0
-        self.pattern = None
-        self.last_command = None
-        
-    def connect(self):
-        self.connected = True
-        return True
-        
-    def disconnect(self):
-        self.connected = False
-        return True
-        
-    def vibrate(self, pattern, intensity=1.0, duration=100):
-        if not self.connected:
-            return False
-        self.vibration_active = True
-        self.pattern = pattern
-        self.intensity = intensity
-        return True
-        
-    def stop(self):
-        if not self.connected:
-            return False
-        self.vibration_active = False
-        self.pattern = None
-        self.intensity = 0
-        return True
-        
-    def execute_command(self, command):
-        self.last_command = command
-        return True
+# Cas des tests paramétrés (tuples immuables partagés)
+_HAPTIC_PATTERNS = ('click', 'double_click', 'error', 'success', 'scroll', 'notification')
+_HAPTIC_INTENSITIES = (0.25, 0.5, 0.75, 1.0)
+_HAPTIC_COMMANDS = ('calibrate', 'reset', 'test', 'status')
 
 class MockHapticFeedback:
+    __slots__ = ('patterns',)
+    
     def __init__(self):
         self.patterns = {
             'click': [100],  # 100ms de vibration
@@ -70,89 +38,67 @@ class MockHapticFeedback:
     def create_pattern(self, pattern):
         return pattern
 
+# Prototypes construits une seule fois, copiés par les fixtures
+_PROTO_HAPTIC_CONTROLLER = MockHapticController()
+_PROTO_HAPTIC_FEEDBACK = MockHapticFeedback()
+
 @pytest.fixture
 def mock_haptic_controller():
     """Fixture fournissant un mock de contrôleur haptique"""
-    return MockHapticController()
+    return copy.copy(_PROTO_HAPTIC_CONTROLLER)
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_haptic_feedback():
     """Fixture fournissant un mock de retour haptique"""
-    return MockHapticFeedback()
+    return copy.deepcopy(_PROTO_HAPTIC_FEEDBACK)
 
-def test_haptic_initialization(mock_haptic_controller):
-    """Test l'initialisation du contrôleur haptique"""
-    with patch('nvda_linux.haptics.controller._controller', mock_haptic_controller):
-        assert controller.initialize()
-        assert mock_haptic_controller.connected
-        assert controller.cleanup()
-        assert not mock_haptic_controller.connected
-
-def test_haptic_patterns(mock_haptic_controller, mock_haptic_feedback):
+@pytest.mark.parametrize("pattern_name", _HAPTIC_PATTERNS)
+def test_haptic_patterns(mock_haptic_controller, mock_haptic_feedback, pattern_name):
     """Test les patterns de vibration"""
-    with patch('nvda_linux.haptics.controller._controller', mock_haptic_controller), \
-         patch('nvda_linux.haptics.feedback._feedback', mock_haptic_feedback):
+    with swap_attr(controller, '_controller', mock_haptic_controller), \
+         swap_attr(feedback, '_feedback', mock_haptic_feedback):
         
         controller.initialize()
         
-        # Test des patterns prédéfinis
-        patterns = [
-            'click',
-            'double_click',
-            'error',
-            'success',
-            'scroll',
-            'notification'
-        ]
-        
-        for pattern_name in patterns:
-            pattern = mock_haptic_feedback.get_pattern(pattern_name)
-            assert controller.vibrate(pattern)
-            assert mock_haptic_controller.pattern == pattern
-            assert mock_haptic_controller.vibration_active
-            
-            controller.stop()
-            assert not mock_haptic_controller.vibration_active
+        # Test du pattern prédéfini
+        pattern = mock_haptic_feedback.get_pattern(pattern_name)
+        assert controller.vibrate(pattern)
+        assert mock_haptic_controller.pattern == pattern
+        assert mock_haptic_controller.vibration_active
+        
+        controller.stop()
+        assert not mock_haptic_controller.vibration_active
         
         controller.cleanup()
 
-def test_haptic_intensity(mock_haptic_controller):
+@pytest.mark.parametrize("intensity", _HAPTIC_INTENSITIES)
+def test_haptic_intensity(mock_haptic_controller, intensity):
     """Test le contrôle de l'intensité"""
-    with patch('nvda_linux.haptics.controller._controller', mock_haptic_controller):
+    with swap_attr(controller, '_controller', mock_haptic_controller):
         controller.initialize()
         
-        # Test de différentes intensités
-        intensities = [0.25, 0.5, 0.75, 1.0]
-        
-        for intensity in intensities:
-            assert controller.vibrate([100], intensity=intensity)
-            assert mock_haptic_controller.intensity == intensity
-            controller.stop()
+        # Test de l'intensité
+        assert controller.vibrate([100], intensity=intensity)
+        assert mock_haptic_controller.intensity == intensity
+        controller.stop()
         
         controller.cleanup()
 
-def test_haptic_commands(mock_haptic_controller):
+@pytest.mark.parametrize("command", _HAPTIC_COMMANDS)
+def test_haptic_commands(mock_haptic_controller, command):
     """Test les commandes du contrôleur haptique"""
-    with patch('nvda_linux.haptics.controller._controller', mock_haptic_controller):
+    with swap_attr(controller, '_controller', mock_haptic_controller):
         controller.initialize()
         
-        # Test des commandes de base
-        commands = [
-            'calibrate',
-            'reset',
-            'test',
-            'status'
-        ]
-        
-        for command in commands:
-            assert controller.execute_command(command)
-            assert mock_haptic_controller.last_command == command
+        # Test de la commande de base
+        assert controller.execute_command(command)
+        assert mock_haptic_controller.last_command == command
         
         controller.cleanup()
 
 def test_haptic_error_handling(mock_haptic_controller):
     """Test la gestion des erreurs"""
-    with patch('nvda_linux.haptics.controller._controller', mock_haptic_controller):
+    with swap_attr(controller, '_controller', mock_haptic_controller):
         # Test avec un contrôleur non connecté
         mock_haptic_controller.connected = False
         assert not controller.vibrate([100])
@@ -169,8 +115,8 @@ def test_haptic_error_handling(mock_haptic_controller):
 
 def test_haptic_custom_patterns(mock_haptic_controller, mock_haptic_feedback):
     """Test la création de patterns personnalisés"""
-    with patch('nvda_linux.haptics.controller._controller', mock_haptic_controller), \
-         patch('nvda_linux.haptics.feedback._feedback', mock_haptic_feedback):
+    with swap_attr(controller, '_controller', mock_haptic_controller), \
+         swap_attr(feedback, '_feedback', mock_haptic_feedback):
         
         controller.initialize()
         
@@ -185,7 +131,7 @@ def test_haptic_custom_patterns(mock_haptic_controller, mock_haptic_feedback):
 
 def test_haptic_configuration(mock_haptic_controller):
     """Test la configuration du contrôleur haptique"""
-    with patch('nvda_linux.haptics.controller._controller', mock_haptic_controller):
+    with swap_attr(controller, '_controller', mock_haptic_controller):
         controller.initialize()
         
         # Test de la configuration
@@ -203,31 +149,28 @@ def test_haptic_configuration(mock_haptic_controller):
         
         controller.cleanup()
 
+@pytest.mark.benchmark
 def test_haptic_performance(mock_haptic_controller):
     """Test les performances du contrôleur haptique"""
-    with patch('nvda_linux.haptics.controller._controller', mock_haptic_controller):
+    with swap_attr(controller, '_controller', mock_haptic_controller):
         controller.initialize()
         
         # Test de performance avec des vibrations rapides
-        import time
-        
-        start_time = time.time()
-        
-        for _ in range(100):  # 100 itérations
+        # (autorange calibre lui-même le nombre d'itérations)
+        def vibrate_and_stop():
             controller.vibrate([50])
             controller.stop()
-            
-        end_time = time.time()
-        duration = end_time - start_time
+        
+        count, duration = Timer(vibrate_and_stop).autorange()
         
         # Vérifier que le temps d'exécution est raisonnable
-        assert duration < 1.0  # Moins d'une seconde pour 100 itérations
+        assert duration / count < 0.01  # Moins de 10 ms par vibration
         
         controller.cleanup()
 
 def test_haptic_synchronization(mock_haptic_controller):
     """Test la synchronisation des vibrations"""
-    with patch('nvda_linux.haptics.controller._controller', mock_haptic_controller):
+    with swap_attr(controller, '_controller', mock_haptic_controller):
         controller.initialize()
         
         # Test de synchronisation avec des patterns complexes
@@ -0,0 +1,23 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Tests d'initialisation des modules d'accessibilité
+Vérifie le cycle initialize/cleanup de l'IA, du braille et de l'haptique
+"""
+
+import importlib
+import pytest
+
+from ..helpers import swap_attr, INIT_CASES
+
+@pytest.mark.parametrize("module_name,attr,mock_class,flag", INIT_CASES)
+def test_initialize_cleanup(module_name, attr, mock_class, flag):
+    """Test l'initialisation puis le nettoyage d'un module"""
+    module = importlib.import_module(module_name)
+    mock = mock_class()
+    with swap_attr(module, attr, mock):
+        assert module.initialize()
+        assert getattr(mock, flag)
+        assert module.cleanup()
+        assert not getattr(mock, flag)
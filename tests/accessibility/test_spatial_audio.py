@@ -7,26 +7,78 @@ Teste les fonctionnalités de son 3D et de spatialisation
 """
 
 import pytest
-from unittest.mock import patch, MagicMock
+import math
 import sys
-import os
+import time
 from pathlib import Path
 import numpy as np
 
-# Ajouter le répertoire parent au PYTHONPATH
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+from ..helpers import swap_attr
 
-from nvda_linux.audio_spatial import spatializer, calibration
+# Numba est optionnel et ne sert qu'à la mesure de performance (fixture euler_to_quat_jit)
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Cas de test partagés, construits une seule fois à l'import
+_SOUND_POSITIONS = (
+    (1, 0, 0),   # Droite
+    (-1, 0, 0),  # Gauche
+    (0, 1, 0),   # Avant
+    (0, -1, 0),  # Arrière
+    (0, 0, 1),   # Haut
+    (0, 0, -1)   # Bas
+)
+_LISTENER_POSITIONS = (
+    (0, 0, 0),    # Centre
+    (1, 1, 0),    # Coin avant droit
+    (-1, -1, 0),  # Coin arrière gauche
+    (0, 0, 1.5)   # Debout
+)
+_ORIENTATIONS = (
+    (0, 0, 0),     # Face à l'avant
+    (90, 0, 0),    # Tourné à droite
+    (-90, 0, 0),   # Tourné à gauche
+    (0, 45, 0),    # Regardant en haut
+    (0, -45, 0)    # Regardant en bas
+)
+_SOUNDS = (
+    ('click', (1, 0, 0)),
+    ('notification', (0, 1, 0)),
+    ('alert', (0, 0, 1))
+)
+
+def _euler_to_quat(yaw, pitch, roll, out):
+    """Écrit dans out le quaternion (w, x, y, z) d'une orientation en degrés"""
+    cy = math.cos(math.radians(yaw) * 0.5)
+    sy = math.sin(math.radians(yaw) * 0.5)
+    cp = math.cos(math.radians(pitch) * 0.5)
+    sp = math.sin(math.radians(pitch) * 0.5)
+    cr = math.cos(math.radians(roll) * 0.5)
+    sr = math.sin(math.radians(roll) * 0.5)
+    out[0] = cr * cp * cy + sr * sp * sy
+    out[1] = sr * cp * cy - cr * sp * sy
+    out[2] = cr * sp * cy + sr * cp * sy
+    out[3] = cr * cp * sy - sr * sp * cy
 
 class MockSpatialAudio:
+    __slots__ = ('initialized', 'calibrated', 'sound_position', 'sound_positions',
+                 'listener_position', '_orient', 'volume', 'last_command', '_noop_count')
+    
     def __init__(self):
         self.initialized = False
         self.calibrated = False
-        self.sound_position = (0, 0, 0)  # (x, y, z)
+        self.sound_position = np.zeros(3, dtype=np.float32)  # (x, y, z)
+        self.sound_positions = self.sound_position.reshape(1, 3)
         self.listener_position = (0, 0, 0)
-        self.listener_orientation = (0, 0, 0)  # (yaw, pitch, roll)
+        # Orientation stockée en quaternion unitaire (w, x, y, z)
+        self._orient = np.zeros(4, dtype=np.float32)
+        self._orient[0] = 1.0
         self.volume = 1.0
         self.last_command = None
+        # Mises à jour ignorées car identiques à la position courante
+        self._noop_count = 0
         
     def initialize(self):
         self.initialized = True
@@ -41,7 +93,19 @@ class MockSpatialAudio:
         return True
         
     def set_sound_position(self, x, y, z):
-        self.sound_position = (x, y, z)
+        current = self.sound_position
+        if current[0] == x and current[1] == y and current[2] == z:
+            self._noop_count += 1
+            return True
+        self.sound_position = np.array((x, y, z), dtype=np.float32)
+        # Le lot courant reste une vue (1, 3) de la position unique
+        self.sound_positions = self.sound_position.reshape(1, 3)
+        return True
+        
+    def set_sound_positions_batch(self, positions):
+        # Une copie unique du tableau (N, 3) ; la dernière ligne devient la position courante
+        self.sound_positions = np.asarray(positions, dtype=np.float32)
+        self.sound_position = self.sound_positions[-1]
         return True
         
     def set_listener_position(self, x, y, z):
@@ -49,9 +113,14 @@ class MockSpatialAudio:
         return True
         
     def set_listener_orientation(self, yaw, pitch, roll):
-        self.listener_orientation = (yaw, pitch, roll)
+        _euler_to_quat(yaw, pitch, roll, self._orient)
         return True
         
+    def orientation_equals(self, yaw, pitch, roll):
+        expected = np.empty(4, dtype=np.float32)
+        _euler_to_quat(yaw, pitch, roll, expected)
+        return np.allclose(self._orient, expected, atol=1e-6)
+        
     def play_sound(self, sound_id, position=None):
         if position:
             self.set_sound_position(*position)
@@ -61,15 +130,23 @@ class MockSpatialAudio:
         return True
 
 class MockAudioCalibration:
+    __slots__ = ('head_radius', 'ear_distance', 'room_size', 'reverb', '_index', 'current_profile')
+    
+    # Profils stockés en colonnes contiguës, indexées par nom de profil
+    _CAPACITY = 16
+    
     def __init__(self):
-        self.profiles = {
-            'default': {
-                'head_radius': 0.1,
-                'ear_distance': 0.2,
-                'room_size': (5, 5, 3),
-                'reverb': 0.3
-            }
-        }
+        self.head_radius = np.empty(self._CAPACITY)
+        self.ear_distance = np.empty(self._CAPACITY)
+        self.room_size = np.empty((self._CAPACITY, 3))
+        self.reverb = np.empty(self._CAPACITY)
+        self._index = {}
+        self.save_profile('default', {
+            'head_radius': 0.1,
+            'ear_distance': 0.2,
+            'room_size': (5, 5, 3),
+            'reverb': 0.3
+        })
         self.current_profile = 'default'
         
     def calibrate(self, profile_name=None):
@@ -78,10 +155,31 @@ class MockAudioCalibration:
         return True
         
     def get_profile(self, profile_name):
-        return self.profiles.get(profile_name)
+        i = self._index.get(profile_name)
+        if i is None:
+            return None
+        return {
+            'head_radius': self.head_radius[i].item(),
+            'ear_distance': self.ear_distance[i].item(),
+            'room_size': tuple(self.room_size[i].tolist()),
+            'reverb': self.reverb[i].item()
+        }
         
     def save_profile(self, profile_name, settings):
-        self.profiles[profile_name] = settings
+        i = self._index.get(profile_name)
+        if i is None:
+            i = len(self._index)
+            if i == len(self.reverb):
+                capacity = 2 * i
+                self.head_radius = np.resize(self.head_radius, capacity)
+                self.ear_distance = np.resize(self.ear_distance, capacity)
+                self.room_size = np.resize(self.room_size, (capacity, 3))
+                self.reverb = np.resize(self.reverb, capacity)
+            self._index[profile_name] = i
+        self.head_radius[i] = settings['head_radius']
+        self.ear_distance[i] = settings['ear_distance']
+        self.room_size[i] = settings['room_size']
+        self.reverb[i] = settings['reverb']
         return True
 
 @pytest.fixture
@@ -94,21 +192,49 @@ def mock_audio_calibration():
     """Fixture fournissant un mock de calibration audio"""
     return MockAudioCalibration()
 
-def test_spatial_audio_initialization(mock_spatial_audio):
+@pytest.fixture(scope="module")
+def spatial_mod():
+    """Fixture important les modules d'audio spatial au premier test qui les utilise"""
+    from nvda_linux.audio_spatial import spatializer, calibration
+    return spatializer, calibration
+
+@pytest.fixture(scope="module")
+def euler_to_quat_jit():
+    """Conversion compilée par numba (si présent), compilée ici et non à l'import"""
+    if njit is None:
+        return _euler_to_quat
+    jitted = njit(cache=True, fastmath=True)(_euler_to_quat)
+    # Compiler avant toute mesure (angles entiers et flottants), jamais dans une boucle chronométrée
+    jitted(0, 0, 0, np.empty(4, dtype=np.float32))
+    jitted(0.0, 0.0, 0.0, np.empty(4, dtype=np.float32))
+    return jitted
+
+@pytest.fixture
+def spat_uninitialized(spatial_mod, mock_spatial_audio):
+    """Fixture fournissant le spatialiseur branché sur le mock, sans l'initialiser"""
+    spatializer, _ = spatial_mod
+    with swap_attr(spatializer, '_spatial_audio', mock_spatial_audio):
+        yield spatializer
+
+@pytest.fixture
+def spat(spat_uninitialized):
+    """Fixture fournissant le spatialiseur initialisé, nettoyé même en cas d'échec"""
+    spat_uninitialized.initialize()
+    yield spat_uninitialized
+    spat_uninitialized.cleanup()
+
+def test_spatial_audio_initialization(spat_uninitialized, mock_spatial_audio):
     """Test l'initialisation de l'audio spatial"""
-    with patch('nvda_linux.audio_spatial.spatializer._spatial_audio', mock_spatial_audio):
-        assert spatializer.initialize()
-        assert mock_spatial_audio.initialized
-        assert spatializer.cleanup()
-        assert not mock_spatial_audio.initialized
+    assert spat_uninitialized.initialize()
+    assert mock_spatial_audio.initialized
+    assert spat_uninitialized.cleanup()
+    assert not mock_spatial_audio.initialized
 
-def test_audio_calibration(mock_spatial_audio, mock_audio_calibration):
+def test_audio_calibration(spat, spatial_mod, mock_spatial_audio, mock_audio_calibration,
+                           assert_profile_equal):
     """Test la calibration audio"""
-    with patch('nvda_linux.audio_spatial.spatializer._spatial_audio', mock_spatial_audio), \
-         patch('nvda_linux.audio_spatial.calibration._calibration', mock_audio_calibration):
-        
-        spatializer.initialize()
-        
+    _, calibration = spatial_mod
+    with swap_attr(calibration, '_calibration', mock_audio_calibration):
         # Test de calibration par défaut
         assert calibration.calibrate()
         assert mock_spatial_audio.calibrated
@@ -125,110 +251,60 @@ def test_audio_calibration(mock_spatial_audio, mock_audio_calibration):
         assert calibration.calibrate('custom')
         
         profile = calibration.get_profile('custom')
-        assert profile == custom_profile
-        
-        spatializer.cleanup()
+        assert_profile_equal(profile, custom_profile)
 
-def test_sound_positioning(mock_spatial_audio):
+@pytest.mark.parametrize("pos", _SOUND_POSITIONS)
+def test_sound_positioning(spat, mock_spatial_audio, assert_vec_equal, pos):
     """Test le positionnement des sons"""
-    with patch('nvda_linux.audio_spatial.spatializer._spatial_audio', mock_spatial_audio):
-        spatializer.initialize()
-        
-        # Test de différentes positions
-        positions = [
-            (1, 0, 0),   # Droite
-            (-1, 0, 0),  # Gauche
-            (0, 1, 0),   # Avant
-            (0, -1, 0),  # Arrière
-            (0, 0, 1),   # Haut
-            (0, 0, -1)   # Bas
-        ]
-        
-        for pos in positions:
-            assert spatializer.set_sound_position(*pos)
-            assert mock_spatial_audio.sound_position == pos
-        
-        spatializer.cleanup()
+    assert spat.set_sound_position(*pos)
+    assert_vec_equal(mock_spatial_audio.sound_position, pos)
+
+def test_sound_positions_batch(mock_spatial_audio):
+    """Test le positionnement de plusieurs sons en un seul appel"""
+    positions_array = np.array(_SOUND_POSITIONS, dtype=np.float32)
+    assert mock_spatial_audio.set_sound_positions_batch(positions_array)
+    assert np.allclose(mock_spatial_audio.sound_positions, positions_array, atol=1e-6)
 
-def test_listener_positioning(mock_spatial_audio):
+@pytest.mark.parametrize("pos", _LISTENER_POSITIONS)
+def test_listener_positioning(spat, mock_spatial_audio, assert_vec_equal, pos):
     """Test le positionnement de l'auditeur"""
-    with patch('nvda_linux.audio_spatial.spatializer._spatial_audio', mock_spatial_audio):
-        spatializer.initialize()
-        
-        # Test de différentes positions d'auditeur
-        positions = [
-            (0, 0, 0),    # Centre
-            (1, 1, 0),    # Coin avant droit
-            (-1, -1, 0),  # Coin arrière gauche
-            (0, 0, 1.5)   # Debout
-        ]
-        
-        for pos in positions:
-            assert spatializer.set_listener_position(*pos)
-            assert mock_spatial_audio.listener_position == pos
-        
-        spatializer.cleanup()
+    assert spat.set_listener_position(*pos)
+    assert_vec_equal(mock_spatial_audio.listener_position, pos)
 
-def test_listener_orientation(mock_spatial_audio):
+@pytest.mark.parametrize("orient", _ORIENTATIONS)
+def test_listener_orientation(spat, mock_spatial_audio, orient):
     """Test l'orientation de l'auditeur"""
-    with patch('nvda_linux.audio_spatial.spatializer._spatial_audio', mock_spatial_audio):
-        spatializer.initialize()
-        
-        # Test de différentes orientations
-        orientations = [
-            (0, 0, 0),     # Face à l'avant
-            (90, 0, 0),    # Tourné à droite
-            (-90, 0, 0),   # Tourné à gauche
-            (0, 45, 0),    # Regardant en haut
-            (0, -45, 0)    # Regardant en bas
-        ]
-        
-        for orient in orientations:
-            assert spatializer.set_listener_orientation(*orient)
-            assert mock_spatial_audio.listener_orientation == orient
-        
-        spatializer.cleanup()
+    assert spat.set_listener_orientation(*orient)
+    assert mock_spatial_audio.orientation_equals(*orient)
 
-def test_sound_playback(mock_spatial_audio):
+@pytest.mark.parametrize("sound_id, position", _SOUNDS)
+def test_sound_playback(spat, mock_spatial_audio, assert_vec_equal, sound_id, position):
     """Test la lecture des sons"""
-    with patch('nvda_linux.audio_spatial.spatializer._spatial_audio', mock_spatial_audio):
-        spatializer.initialize()
-        
-        # Test de lecture de sons à différentes positions
-        sounds = [
-            ('click', (1, 0, 0)),
-            ('notification', (0, 1, 0)),
-            ('alert', (0, 0, 1))
-        ]
-        
-        for sound_id, position in sounds:
-            assert spatializer.play_sound(sound_id, position)
-            assert mock_spatial_audio.sound_position == position
-            assert spatializer.stop_sound(sound_id)
-        
-        spatializer.cleanup()
+    assert spat.play_sound(sound_id, position)
+    assert_vec_equal(mock_spatial_audio.sound_position, position)
+    assert spat.stop_sound(sound_id)
 
-def test_error_handling(mock_spatial_audio):
+def test_error_handling(spat_uninitialized, mock_spatial_audio):
     """Test la gestion des erreurs"""
-    with patch('nvda_linux.audio_spatial.spatializer._spatial_audio', mock_spatial_audio):
-        # Test avec un système non initialisé
-        mock_spatial_audio.initialized = False
-        assert not spatializer.set_sound_position(1, 0, 0)
-        
-        # Test avec des positions invalides
-        spatializer.initialize()
-        assert not spatializer.set_sound_position(None, 0, 0)
-        assert not spatializer.set_listener_position(0, None, 0)
-        assert not spatializer.set_listener_orientation(None, 0, 0)
-        
-        # Test avec un son invalide
-        assert not spatializer.play_sound(None)
-        
-        spatializer.cleanup()
+    # Test avec un système non initialisé
+    mock_spatial_audio.initialized = False
+    assert not spat_uninitialized.set_sound_position(1, 0, 0)
+    
+    # Test avec des positions invalides
+    spat_uninitialized.initialize()
+    assert not spat_uninitialized.set_sound_position(None, 0, 0)
+    assert not spat_uninitialized.set_listener_position(0, None, 0)
+    assert not spat_uninitialized.set_listener_orientation(None, 0, 0)
+    
+    # Test avec un son invalide
+    assert not spat_uninitialized.play_sound(None)
+    
+    spat_uninitialized.cleanup()
 
-def test_audio_profiles(mock_audio_calibration):
+def test_audio_profiles(spatial_mod, mock_audio_calibration, assert_profile_equal):
     """Test la gestion des profils audio"""
-    with patch('nvda_linux.audio_spatial.calibration._calibration', mock_audio_calibration):
+    _, calibration = spatial_mod
+    with swap_attr(calibration, '_calibration', mock_audio_calibration):
         # Test de création de profils
         profiles = {
             'small_room': {
@@ -248,27 +324,27 @@ def test_audio_profiles(mock_audio_calibration):
         for name, settings in profiles.items():
             assert calibration.save_profile(name, settings)
             profile = calibration.get_profile(name)
-            assert profile == settings
+            assert_profile_equal(profile, settings)
 
-def test_performance(mock_spatial_audio):
+@pytest.mark.benchmark
+def test_performance(spat, mock_spatial_audio, euler_to_quat_jit):
     """Test les performances de l'audio spatial"""
-    with patch('nvda_linux.audio_spatial.spatializer._spatial_audio', mock_spatial_audio):
-        spatializer.initialize()
-        
-        import time
-        
-        # Test de performance avec des mises à jour rapides
-        start_time = time.time()
-        
-        for _ in range(100):  # 100 itérations
-            spatializer.set_sound_position(1, 0, 0)
-            spatializer.set_listener_position(0, 1, 0)
-            spatializer.set_listener_orientation(45, 0, 0)
-            
-        end_time = time.time()
-        duration = end_time - start_time
-        
-        # Vérifier que le temps d'exécution est raisonnable
-        assert duration < 1.0  # Moins d'une seconde pour 100 itérations
-        
-        spatializer.cleanup() 
\ No newline at end of file
+    # Test de performance avec des mises à jour rapides
+    set_pos = spat.set_sound_position
+    set_lpos = spat.set_listener_position
+    set_orient = spat.set_listener_orientation
+    
+    # Seule la mesure utilise la conversion compilée
+    with swap_attr(sys.modules[__name__], '_euler_to_quat', euler_to_quat_jit):
+        start = time.perf_counter_ns()
+        for _ in range(10_000):  # 10 000 itérations
+            set_pos(1, 0, 0)
+            set_lpos(0, 1, 0)
+            set_orient(45, 0, 0)
+        duration_ns = time.perf_counter_ns() - start
+    
+    # Vérifier que le temps d'exécution est raisonnable
+    assert duration_ns < 500_000_000  # Moins de 500 ms pour 10 000 itérations
+    
+    # Seule la première mise à jour modifie la position, les suivantes sont ignorées
+    assert mock_spatial_audio._noop_count >= 9_999
\ No newline at end of file
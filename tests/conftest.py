@@ -7,9 +7,19 @@ Contient les fixtures partagées entre tous les tests
 """
 
 import pytest
+import copy
+import functools
 import logging
+import math
 import sys
+from enum import IntEnum
 from pathlib import Path
+from types import MappingProxyType
+
+# Racine du dépôt dans le PYTHONPATH, une seule fois pour toute la suite
+_ROOT = str(Path(__file__).resolve().parent.parent)
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
 
 # Configuration du logging pour les tests
 logging.basicConfig(
@@ -20,37 +30,70 @@ logging.basicConfig(
     ]
 )
 
+def _freeze(mapping):
+    """Retourne une vue en lecture seule, récursive, aux chaînes internées"""
+    return MappingProxyType({
+        sys.intern(k) if isinstance(k, str) else k:
+            _freeze(v) if isinstance(v, dict) else
+            sys.intern(v) if isinstance(v, str) else v
+        for k, v in mapping.items()
+    })
+
+# Configuration de test construite une seule fois, partagée en lecture seule
+_TEST_CONFIG = _freeze({
+    'voix': {
+        'moteur': 'espeak',
+        'langue': 'fr',
+        'vitesse': 180,
+        'volume': 100,
+        'personnalisation': False  # Désactivé pour les tests
+    },
+    'braille': {
+        'afficheur': 'test',
+        'traduction_temps_reel': False,
+        'paramètres': {}
+    },
+    'haptique': {
+        'contrôleur': 'test',
+        'retour_personnalisé': False
+    },
+    'audio_spatial': {
+        'casque': 'test',
+        'calibration': False
+    },
+    'ia': {
+        'reconnaissance_image': False,
+        'ocr': False,
+        'description_interface': False,
+        'navigation_contextuelle': False
+    }
+})
+
 @pytest.fixture(scope="session")
 def test_config():
     """Fixture fournissant une configuration de test"""
-    return {
-        'voix': {
-            'moteur': 'espeak',
-            'langue': 'fr',
-            'vitesse': 180,
-            'volume': 100,
-            'personnalisation': False  # Désactivé pour les tests
-        },
-        'braille': {
-            'afficheur': 'test',
-            'traduction_temps_reel': False,
-            'paramètres': {}
-        },
-        'haptique': {
-            'contrôleur': 'test',
-            'retour_personnalisé': False
-        },
-        'audio_spatial': {
-            'casque': 'test',
-            'calibration': False
-        },
-        'ia': {
-            'reconnaissance_image': False,
-            'ocr': False,
-            'description_interface': False,
-            'navigation_contextuelle': False
-        }
-    }
+    return _TEST_CONFIG
+
+@pytest.fixture(scope="session")
+def _base_config():
+    """Configuration par défaut du projet, lue une seule fois pour la session"""
+    import config
+    return config.get_config()
+
+@pytest.fixture
+def default_config(_base_config):
+    """Fixture fournissant une copie modifiable de la configuration par défaut"""
+    return copy.deepcopy(_base_config)
+
+@pytest.fixture(scope="session")
+def platform_config():
+    """Fixture fournissant la configuration d'une plateforme, mise en cache par nom"""
+    import config
+    
+    @functools.lru_cache(maxsize=4)
+    def _platform_config(platform_name):
+        return config.get_platform_config(platform_name)
+    return _platform_config
 
 @pytest.fixture(scope="session")
 def test_logger():
@@ -65,10 +108,37 @@ def test_data_dir():
     return Path(__file__).parent / 'data'
 
 @pytest.fixture(scope="session")
-def mock_atspi():
-    """Fixture fournissant un mock de l'interface AT-SPI"""
+def assert_vec_equal():
+    """Fixture fournissant une comparaison de vecteurs tolérante aux arrondis flottants"""
+    def _assert_vec_equal(actual, expected, abs_tol=1e-6):
+        assert len(actual) == len(expected), f"{actual} != {expected}"
+        assert all(
+            math.isclose(a, e, abs_tol=abs_tol) for a, e in zip(actual, expected)
+        ), f"{actual} != {expected}"
+    return _assert_vec_equal
+
+@pytest.fixture(scope="session")
+def assert_profile_equal():
+    """Fixture fournissant une comparaison de profils tolérante au stockage flottant réduit"""
+    def _assert_profile_equal(got, want, tol=1e-6):
+        assert got is not None and got.keys() == want.keys(), f"{got} != {want}"
+        for key, expected in want.items():
+            value = got[key]
+            if isinstance(expected, (tuple, list)):
+                assert len(value) == len(expected), f"{key}: {value} != {expected}"
+                assert all(
+                    math.isclose(v, e, rel_tol=tol, abs_tol=tol) for v, e in zip(value, expected)
+                ), f"{key}: {value} != {expected}"
+            else:
+                assert math.isclose(value, expected, rel_tol=tol, abs_tol=tol), \
+                    f"{key}: {value} != {expected}"
+    return _assert_profile_equal
+
+@pytest.fixture(scope="session")
+def _proto_atspi():
+    """Prototype construit une seule fois : un mock de l'interface AT-SPI"""
     class MockAtspi:
-        class Role:
+        class Role(IntEnum):
             PUSH_BUTTON = 1
             MENU = 2
             MENU_ITEM = 3
@@ -90,8 +160,8 @@ def mock_atspi():
     return MockAtspi()
 
 @pytest.fixture(scope="session")
-def mock_speech_engine():
-    """Fixture fournissant un mock du moteur de synthèse vocale"""
+def _proto_speech_engine():
+    """Prototype construit une seule fois : un mock du moteur de synthèse vocale"""
     class MockSpeechEngine:
         def __init__(self):
             self.last_spoken = None
@@ -107,12 +177,14 @@ def mock_speech_engine():
     return MockSpeechEngine()
 
 @pytest.fixture(scope="session")
-def mock_input_manager():
-    """Fixture fournissant un mock du gestionnaire d'entrées"""
+def _proto_input_manager():
+    """Prototype construit une seule fois : un mock du gestionnaire d'entrées"""
     class MockInputManager:
         def __init__(self):
             self.is_listening = False
             self.last_key = None
+            # Tuple réaffecté (jamais muté) : les copies superficielles restent isolées
+            self.history = ()
             
         def start(self):
             self.is_listening = True
@@ -124,6 +196,29 @@ def mock_input_manager():
             
         def simulate_key(self, key):
             self.last_key = key
+            self.history += (key,)
+            return True
+            
+        def simulate_keys(self, keys):
+            keys = tuple(keys)
+            if keys:
+                self.last_key = keys[-1]
+                self.history += keys
             return True
             
-    return MockInputManager() 
\ No newline at end of file
+    return MockInputManager()
+
+@pytest.fixture
+def mock_atspi(_proto_atspi):
+    """Fixture fournissant un mock de l'interface AT-SPI"""
+    return copy.copy(_proto_atspi)
+
+@pytest.fixture
+def mock_speech_engine(_proto_speech_engine):
+    """Fixture fournissant un mock du moteur de synthèse vocale"""
+    return copy.copy(_proto_speech_engine)
+
+@pytest.fixture
+def mock_input_manager(_proto_input_manager):
+    """Fixture fournissant un mock du gestionnaire d'entrées"""
+    return copy.copy(_proto_input_manager)
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Utilitaires partagés par les tests
+"""
+
+from contextlib import contextmanager
+
+import numpy as np
+import pytest
+
+@contextmanager
+def swap_attr(module, name, value):
+    """Remplace temporairement un attribut de module, sans passer par mock.patch"""
+    old = getattr(module, name)
+    setattr(module, name, value)
+    try:
+        yield value
+    finally:
+        setattr(module, name, old)
+
+class MockImageRecognition:
+    __slots__ = ('initialized', 'models_loaded', 'last_image', 'last_results')
+    
+    # Carte de profondeur partagée en lecture seule : copier avant toute modification
+    _DEPTH_ZEROS = np.zeros((100, 100), dtype=np.float32)
+    _DEPTH_ZEROS.flags.writeable = False
+    
+    def __init__(self):
+        self.initialized = False
+        self.models_loaded = {}
+        self.last_image = None
+        self.last_results = None
+        
+    def initialize(self):
+        self.initialized = True
+        return True
+        
+    def cleanup(self):
+        self.initialized = False
+        self.models_loaded = {}
+        return True
+        
+    def load_model(self, model_name):
+        self.models_loaded[model_name] = True
+        return True
+        
+    def recognize_objects(self, image):
+        self.last_image = image
+        # Simuler des résultats de reconnaissance
+        self.last_results = [
+            {'label': 'person', 'confidence': 0.95, 'box': [100, 100, 200, 300]},
+            {'label': 'chair', 'confidence': 0.85, 'box': [300, 200, 400, 400]}
+        ]
+        return self.last_results
+        
+    def estimate_depth(self, image):
+        self.last_image = image
+        # Simuler une carte de profondeur
+        return self._DEPTH_ZEROS
+
+class MockOCR:
+    __slots__ = ('initialized', 'languages', 'last_image', 'last_text')
+    _TEXT = "Texte de test"
+    
+    def __init__(self):
+        self.initialized = False
+        self.languages = ['fr', 'en']
+        self.last_image = None
+        self.last_text = None
+        
+    def initialize(self):
+        self.initialized = True
+        return True
+        
+    def cleanup(self):
+        self.initialized = False
+        return True
+        
+    def recognize_text(self, image, language='fr'):
+        self.last_image = image
+        self.last_text = self._TEXT
+        return self._TEXT
+        
+    def get_available_languages(self):
+        return self.languages
+
+class MockInterfaceDescription:
+    __slots__ = ('initialized', 'last_element', 'last_description')
+    _DESCRIPTION = "Description de test"
+    
+    def __init__(self):
+        self.initialized = False
+        self.last_element = None
+        self.last_description = None
+        
+    def initialize(self):
+        self.initialized = True
+        return True
+        
+    def cleanup(self):
+        self.initialized = False
+        return True
+        
+    def describe_element(self, element):
+        self.last_element = element
+        self.last_description = self._DESCRIPTION
+        return self._DESCRIPTION
+        
+    def describe_interface(self, elements):
+        return "Description de l'interface de test"
+
+class MockBrailleDisplay:
+    __slots__ = ('connected', 'cells', 'last_text', 'last_command')
+    
+    def __init__(self):
+        self.connected = False
+        self.cells = [0] * 40  # 40 cellules par défaut
+        self.last_text = None
+        self.last_command = None
+        
+    def connect(self):
+        self.connected = True
+        return True
+        
+    def disconnect(self):
+        self.connected = False
+        return True
+        
+    def write_cells(self, cells):
+        # Écriture en place : aucune nouvelle liste n'est allouée
+        size = len(self.cells)
+        count = len(cells)
+        if count > size:
+            return False
+        self.cells[:count] = cells
+        for i in range(count, size):
+            self.cells[i] = 0
+        return True
+        
+    def execute_command(self, command):
+        self.last_command = command
+        return True
+
+class MockHapticController:
+    __slots__ = ('connected', 'vibration_active', 'intensity', 'pattern', 'last_command')
+    
+    def __init__(self):
+        self.connected = False
+        self.vibration_active = False
+        self.intensity = 0
+        self.pattern = None
+        self.last_command = None
+        
+    def connect(self):
+        self.connected = True
+        return True
+        
+    def disconnect(self):
+        self.connected = False
+        return True
+        
+    def vibrate(self, pattern, intensity=1.0, duration=100):
+        if not self.connected:
+            return False
+        self.vibration_active = True
+        self.pattern = pattern
+        self.intensity = intensity
+        return True
+        
+    def stop(self):
+        if not self.connected:
+            return False
+        self.vibration_active = False
+        self.pattern = None
+        self.intensity = 0
+        return True
+        
+    def execute_command(self, command):
+        self.last_command = command
+        return True
+
+# (module, attribut remplacé, classe du mock, indicateur d'état attendu)
+# Les modules sont nommés et non importés : l'import se fait à l'exécution du test
+INIT_CASES = [
+    pytest.param('nvda_linux.ai.recognition', '_recognition', MockImageRecognition, 'initialized', id='recognition'),
+    pytest.param('nvda_linux.ai.ocr', '_ocr', MockOCR, 'initialized', id='ocr'),
+    pytest.param('nvda_linux.ai.description', '_description', MockInterfaceDescription, 'initialized', id='description'),
+    pytest.param('nvda_linux.braille.display', '_display', MockBrailleDisplay, 'connected', id='braille_display'),
+    pytest.param('nvda_linux.haptics.controller', '_controller', MockHapticController, 'connected', id='haptic_controller')
+]
@@ -6,17 +6,11 @@ Tests d'intégration pour les applications Office
 Teste l'interaction entre les différents composants pour LibreOffice, Microsoft Office et OnlyOffice
 """
 
+import importlib
 import pytest
-from unittest.mock import patch, MagicMock
-import sys
-import os
 from pathlib import Path
 
-# Ajouter le répertoire parent au PYTHONPATH
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
-
-from nvda_linux.apps.office import libreoffice, msoffice, onlyoffice
-from nvda_linux.apps.office import get_app_instance, execute_app_action, get_app_document_info
+from ..helpers import swap_attr
 
 class MockOfficeApp:
     def __init__(self, name, doc_type="document"):
@@ -24,6 +18,11 @@ class MockOfficeApp:
         self.doc_type = doc_type
         self._document = None
         self._focused = None
+        # Table de dispatch construite une fois, au lieu d'une chaîne if/elif à chaque appel
+        self._actions = {
+            'new_document': self._new_document,
+            'save_document': self._save_document
+        }
         
     def get_document_info(self):
         if not self._document:
@@ -34,123 +33,136 @@ class MockOfficeApp:
             'modified': self._document.get('modified', False)
         }
         
+    def _new_document(self, **kwargs):
+        self._document = {'name': 'Nouveau document', 'modified': False}
+        return True
+        
+    def _save_document(self, **kwargs):
+        if not self._document:
+            return False
+        self._document['modified'] = False
+        return True
+        
     def execute_action(self, action, **kwargs):
-        if action == 'new_document':
-            self._document = {'name': 'Nouveau document', 'modified': False}
-            return True
-        elif action == 'save_document':
-            if self._document:
-                self._document['modified'] = False
-                return True
-        return False
+        handler = self._actions.get(action)
+        return handler(**kwargs) if handler else False
+
+# Applications testées et leur nom affiché, chacune exécutée comme un cas distinct
+_DISPLAY_NAMES = {
+    'libreoffice': 'LibreOffice',
+    'msoffice': 'Microsoft Office',
+    'onlyoffice': 'OnlyOffice'
+}
+_OFFICE_APPS = tuple(_DISPLAY_NAMES)
+
+@pytest.fixture(scope="module")
+def office_mod():
+    """Fixture important le paquet Office au premier test qui l'utilise"""
+    from nvda_linux.apps import office
+    return office
+
+@pytest.fixture(scope="module")
+def _office_apps_cache():
+    """Mocks des applications Office, construits une seule fois par module"""
+    return {name: MockOfficeApp(display_name) for name, display_name in _DISPLAY_NAMES.items()}
 
 @pytest.fixture
-def mock_office_apps():
-    """Fixture fournissant des mocks pour les applications Office"""
-    apps = {
-        'libreoffice': MockOfficeApp('LibreOffice'),
-        'msoffice': MockOfficeApp('Microsoft Office'),
-        'onlyoffice': MockOfficeApp('OnlyOffice')
-    }
-    return apps
+def mock_office_apps(_office_apps_cache):
+    """Fixture fournissant des mocks pour les applications Office, remis à zéro pour chaque test"""
+    for name, app in _office_apps_cache.items():
+        # Les attributs en lecture seule ne doivent jamais être modifiés par un test
+        assert app.name == _DISPLAY_NAMES[name] and app.doc_type == 'document'
+        app._document = None
+        app._focused = None
+    # Nouveau dictionnaire à chaque test : cleanup() vide celui qu'on lui confie
+    return dict(_office_apps_cache)
 
-def test_office_app_initialization(mock_office_apps):
+@pytest.mark.parametrize("app_name, display_name", tuple(_DISPLAY_NAMES.items()))
+def test_office_app_initialization(office_mod, mock_office_apps, app_name, display_name):
     """Test l'initialisation des applications Office"""
-    with patch('nvda_linux.apps.office._office_instances', mock_office_apps):
-        # Test LibreOffice
-        assert libreoffice.initialize()
-        app = get_app_instance('libreoffice')
+    module = importlib.import_module(f'{office_mod.__name__}.{app_name}')
+    with swap_attr(office_mod, '_office_instances', mock_office_apps):
+        assert module.initialize()
+        app = office_mod.get_app_instance(app_name)
         assert app is not None
-        assert app.name == 'LibreOffice'
-        
-        # Test Microsoft Office
-        assert msoffice.initialize()
-        app = get_app_instance('msoffice')
-        assert app is not None
-        assert app.name == 'Microsoft Office'
-        
-        # Test OnlyOffice
-        assert onlyoffice.initialize()
-        app = get_app_instance('onlyoffice')
-        assert app is not None
-        assert app.name == 'OnlyOffice'
+        assert app.name == display_name
 
-def test_document_operations(mock_office_apps):
+@pytest.mark.parametrize("app_name", _OFFICE_APPS)
+def test_document_operations(office_mod, mock_office_apps, app_name):
     """Test les opérations sur les documents"""
-    with patch('nvda_linux.apps.office._office_instances', mock_office_apps):
+    with swap_attr(office_mod, '_office_instances', mock_office_apps):
         # Test création de document
-        for app_name in ['libreoffice', 'msoffice', 'onlyoffice']:
-            assert execute_app_action(app_name, 'new_document')
-            doc_info = get_app_document_info(app_name)
-            assert doc_info is not None
-            assert doc_info['name'] == 'Nouveau document'
-            assert not doc_info['modified']
-            
-            # Test sauvegarde
-            assert execute_app_action(app_name, 'save_document')
-            doc_info = get_app_document_info(app_name)
-            assert not doc_info['modified']
+        assert office_mod.execute_app_action(app_name, 'new_document')
+        doc_info = office_mod.get_app_document_info(app_name)
+        assert doc_info is not None
+        assert doc_info['name'] == 'Nouveau document'
+        assert not doc_info['modified']
+        
+        # Test sauvegarde
+        assert office_mod.execute_app_action(app_name, 'save_document')
+        doc_info = office_mod.get_app_document_info(app_name)
+        assert not doc_info['modified']
 
-def test_app_interaction(mock_office_apps, mock_speech_engine):
+@pytest.mark.parametrize("app_name", _OFFICE_APPS)
+def test_app_interaction(office_mod, mock_office_apps, mock_speech_engine, app_name):
     """Test l'interaction entre les applications et la synthèse vocale"""
-    with patch('nvda_linux.apps.office._office_instances', mock_office_apps), \
-         patch('speech_backend._speech_engine', mock_speech_engine):
+    import speech_backend
+    with swap_attr(office_mod, '_office_instances', mock_office_apps), \
+         swap_attr(speech_backend, '_speech_engine', mock_speech_engine):
         
-        # Initialiser les applications
-        for app_name in ['libreoffice', 'msoffice', 'onlyoffice']:
-            app = get_app_instance(app_name)
-            assert app is not None
-            
-            # Créer un document
-            assert execute_app_action(app_name, 'new_document')
-            
-            # Vérifier que la synthèse vocale est appelée
-            doc_info = get_app_document_info(app_name)
-            assert doc_info is not None
-            assert mock_speech_engine.last_spoken is not None
+        app = office_mod.get_app_instance(app_name)
+        assert app is not None
+        
+        # Créer un document
+        assert office_mod.execute_app_action(app_name, 'new_document')
+        
+        # Vérifier que la synthèse vocale est appelée
+        doc_info = office_mod.get_app_document_info(app_name)
+        assert doc_info is not None
+        assert mock_speech_engine.last_spoken is not None
 
-def test_error_handling(mock_office_apps):
+def test_error_handling(office_mod, mock_office_apps):
     """Test la gestion des erreurs"""
-    with patch('nvda_linux.apps.office._office_instances', mock_office_apps):
+    with swap_attr(office_mod, '_office_instances', mock_office_apps):
         # Test avec une application inexistante
-        assert not execute_app_action('inexistant', 'new_document')
-        assert get_app_document_info('inexistant') is None
+        assert not office_mod.execute_app_action('inexistant', 'new_document')
+        assert office_mod.get_app_document_info('inexistant') is None
         
-        # Test avec une action invalide
-        for app_name in ['libreoffice', 'msoffice', 'onlyoffice']:
-            assert not execute_app_action(app_name, 'action_invalide')
-            
         # Test avec une application non initialisée
         mock_office_apps['libreoffice']._document = None
-        assert get_app_document_info('libreoffice') is None
+        assert office_mod.get_app_document_info('libreoffice') is None
 
-def test_multiple_documents(mock_office_apps):
+@pytest.mark.parametrize("app_name", _OFFICE_APPS)
+def test_invalid_action(office_mod, mock_office_apps, app_name):
+    """Test une action invalide sur chaque application"""
+    with swap_attr(office_mod, '_office_instances', mock_office_apps):
+        assert not office_mod.execute_app_action(app_name, 'action_invalide')
+
+@pytest.mark.parametrize("app_name", _OFFICE_APPS)
+def test_multiple_documents(office_mod, mock_office_apps, app_name):
     """Test la gestion de plusieurs documents"""
-    with patch('nvda_linux.apps.office._office_instances', mock_office_apps):
-        for app_name in ['libreoffice', 'msoffice', 'onlyoffice']:
-            # Créer plusieurs documents
-            for i in range(3):
-                assert execute_app_action(app_name, 'new_document')
-                doc_info = get_app_document_info(app_name)
-                assert doc_info is not None
-                assert doc_info['name'] == 'Nouveau document'
-                
-                # Sauvegarder chaque document
-                assert execute_app_action(app_name, 'save_document')
-                doc_info = get_app_document_info(app_name)
-                assert not doc_info['modified']
+    with swap_attr(office_mod, '_office_instances', mock_office_apps):
+        # Créer plusieurs documents
+        for i in range(3):
+            assert office_mod.execute_app_action(app_name, 'new_document')
+            doc_info = office_mod.get_app_document_info(app_name)
+            assert doc_info is not None
+            assert doc_info['name'] == 'Nouveau document'
+            
+            # Sauvegarder chaque document
+            assert office_mod.execute_app_action(app_name, 'save_document')
+            doc_info = office_mod.get_app_document_info(app_name)
+            assert not doc_info['modified']
 
-def test_app_cleanup(mock_office_apps):
+@pytest.mark.parametrize("app_name", _OFFICE_APPS)
+def test_app_cleanup(office_mod, mock_office_apps, app_name):
     """Test le nettoyage des applications"""
-    with patch('nvda_linux.apps.office._office_instances', mock_office_apps):
-        # Initialiser les applications
-        for app_name in ['libreoffice', 'msoffice', 'onlyoffice']:
-            assert get_app_instance(app_name) is not None
+    with swap_attr(office_mod, '_office_instances', mock_office_apps):
+        # Initialiser l'application
+        assert office_mod.get_app_instance(app_name) is not None
         
         # Nettoyer
-        from nvda_linux.apps.office import cleanup
-        assert cleanup()
+        assert office_mod.cleanup()
         
-        # Vérifier que les instances sont nettoyées
-        for app_name in ['libreoffice', 'msoffice', 'onlyoffice']:
-            assert get_app_instance(app_name) is None 
\ No newline at end of file
+        # Vérifier que l'instance est nettoyée
+        assert office_mod.get_app_instance(app_name) is None
\ No newline at end of file
@@ -6,22 +6,28 @@ Tests unitaires pour le backend AT-SPI
 """
 
 import pytest
-from unittest.mock import patch, MagicMock
-import sys
-import os
+from unittest.mock import patch
+from collections import defaultdict
+from types import SimpleNamespace
 
-# Ajouter le répertoire parent au PYTHONPATH
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+from ..helpers import swap_attr
 
-import atspi_backend
+# États partagés par référence, bien moins coûteux à construire qu'un MagicMock
+_NOT_FOCUSED = SimpleNamespace(contains=lambda *_: False)
+_FOCUSED = SimpleNamespace(contains=lambda *_: True)
+_EMPTY = ()  # Enfants par défaut, partagés sans allocation
+
+def _raise_desktop_error(*args):
+    raise Exception("Erreur de test")
 
 class MockAccessible:
-    def __init__(self, name="", role=None, children=None):
+    __slots__ = ('_name', '_role', '_children', '_state')
+    
+    def __init__(self, name="", role=None, children=_EMPTY, state=_NOT_FOCUSED):
         self._name = name
         self._role = role
-        self._children = children or []
-        self._state = MagicMock()
-        self._state.contains.return_value = False
+        self._children = children
+        self._state = state
         
     def get_name(self):
         return self._name
@@ -38,95 +44,120 @@ class MockAccessible:
     def get_parent(self):
         return None
 
-@pytest.fixture
-def mock_desktop():
-    """Fixture fournissant un mock du bureau"""
-    root = MockAccessible("Desktop", atspi_backend.Atspi.Role.DESKTOP)
-    app1 = MockAccessible("App1", atspi_backend.Atspi.Role.APPLICATION)
-    app2 = MockAccessible("App2", atspi_backend.Atspi.Role.APPLICATION)
-    root._children = [app1, app2]
-    return root
+def _index_by_role(root):
+    """Parcourt l'arbre une seule fois et regroupe ses nœuds par rôle"""
+    index = defaultdict(list)
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        index[node.get_role()].append(node)
+        stack.extend(reversed(node.get_children()))
+    return dict(index)
+
+@pytest.fixture(scope="module")
+def atspi_backend_mod():
+    """Fixture important le backend AT-SPI au premier test qui l'utilise"""
+    import atspi_backend
+    return atspi_backend
 
-def test_initialization(mock_atspi):
+@pytest.fixture(scope="module")
+def mock_desktop(atspi_backend_mod):
+    """Fixture fournissant un mock du bureau, arbre immuable partagé par le module"""
+    app1 = MockAccessible("App1", atspi_backend_mod.Atspi.Role.APPLICATION)
+    app2 = MockAccessible("App2", atspi_backend_mod.Atspi.Role.APPLICATION)
+    return MockAccessible("Desktop", atspi_backend_mod.Atspi.Role.DESKTOP, (app1, app2))
+
+def test_initialization(atspi_backend_mod, mock_atspi):
     """Test l'initialisation du backend AT-SPI"""
-    with patch('atspi_backend.Atspi', mock_atspi):
-        assert atspi_backend.initialize()
-        assert atspi_backend.cleanup()
+    with swap_attr(atspi_backend_mod, 'Atspi', mock_atspi):
+        assert atspi_backend_mod.initialize()
+        assert atspi_backend_mod.cleanup()
 
-def test_get_desktop(mock_atspi, mock_desktop):
+def test_get_desktop(atspi_backend_mod, mock_atspi, mock_desktop):
     """Test la récupération du bureau"""
-    with patch('atspi_backend.Atspi.get_desktop', return_value=mock_desktop):
-        desktop = atspi_backend.get_desktop()
+    with swap_attr(atspi_backend_mod.Atspi, 'get_desktop', lambda *_: mock_desktop):
+        desktop = atspi_backend_mod.get_desktop()
         assert desktop is not None
         assert desktop.get_name() == "Desktop"
         assert len(desktop.get_children()) == 2
 
-def test_find_application(mock_atspi, mock_desktop):
+def test_find_application(atspi_backend_mod, mock_atspi, mock_desktop):
     """Test la recherche d'application"""
-    with patch('atspi_backend.Atspi.get_desktop', return_value=mock_desktop):
-        app = atspi_backend.find_application("App1")
+    with swap_attr(atspi_backend_mod.Atspi, 'get_desktop', lambda *_: mock_desktop):
+        app = atspi_backend_mod.find_application("App1")
         assert app is not None
         assert app.get_name() == "App1"
         
         # Test avec une application inexistante
-        app = atspi_backend.find_application("Inexistant")
+        app = atspi_backend_mod.find_application("Inexistant")
         assert app is None
 
-def test_get_focused_element(mock_atspi):
+def test_get_focused_element(atspi_backend_mod, mock_atspi):
     """Test la récupération de l'élément focalisé"""
-    focused = MockAccessible("Focused", atspi_backend.Atspi.Role.PUSH_BUTTON)
-    focused._state.contains.return_value = True
+    focused = MockAccessible("Focused", atspi_backend_mod.Atspi.Role.PUSH_BUTTON, state=_FOCUSED)
     
-    with patch('atspi_backend.Atspi.get_desktop', return_value=MockAccessible(children=[focused])):
-        element = atspi_backend.get_focused_element()
+    desktop = MockAccessible(children=[focused])
+    with swap_attr(atspi_backend_mod.Atspi, 'get_desktop', lambda *_: desktop):
+        element = atspi_backend_mod.get_focused_element()
         assert element is not None
         assert element.get_name() == "Focused"
 
-def test_get_element_info(mock_atspi):
+def test_get_element_info(atspi_backend_mod, mock_atspi):
     """Test la récupération des informations d'un élément"""
     element = MockAccessible(
         name="Test Element",
-        role=atspi_backend.Atspi.Role.PUSH_BUTTON,
+        role=atspi_backend_mod.Atspi.Role.PUSH_BUTTON,
         children=[
             MockAccessible("Child1"),
             MockAccessible("Child2")
         ]
     )
     
-    info = atspi_backend.get_element_info(element)
+    info = atspi_backend_mod.get_element_info(element)
     assert info is not None
     assert info['name'] == "Test Element"
-    assert info['role'] == atspi_backend.Atspi.Role.PUSH_BUTTON
+    assert info['role'] == atspi_backend_mod.Atspi.Role.PUSH_BUTTON
     assert len(info['children']) == 2
 
-def test_find_element_by_role(mock_atspi):
+def test_find_element_by_role(atspi_backend_mod, mock_atspi):
     """Test la recherche d'élément par rôle"""
-    button = MockAccessible("Button", atspi_backend.Atspi.Role.PUSH_BUTTON)
-    menu = MockAccessible("Menu", atspi_backend.Atspi.Role.MENU)
+    button = MockAccessible("Button", atspi_backend_mod.Atspi.Role.PUSH_BUTTON)
+    menu = MockAccessible("Menu", atspi_backend_mod.Atspi.Role.MENU)
     root = MockAccessible(children=[button, menu])
     
-    elements = atspi_backend.find_elements_by_role(root, atspi_backend.Atspi.Role.PUSH_BUTTON)
+    elements = atspi_backend_mod.find_elements_by_role(root, atspi_backend_mod.Atspi.Role.PUSH_BUTTON)
     assert len(elements) == 1
     assert elements[0].get_name() == "Button"
 
-def test_error_handling(mock_atspi):
+@pytest.fixture(scope="module")
+def desktop_role_index(mock_desktop):
+    """Index rôle -> nœuds du bureau mock, calculé une fois par module"""
+    return _index_by_role(mock_desktop)
+
+def test_find_elements_by_role_on_desktop(atspi_backend_mod, mock_desktop, desktop_role_index):
+    """Test la recherche par rôle sur le bureau, comparée à l'index précalculé"""
+    for role, expected in desktop_role_index.items():
+        elements = atspi_backend_mod.find_elements_by_role(mock_desktop, role)
+        assert [e.get_name() for e in elements] == [e.get_name() for e in expected]
+
+def test_error_handling(atspi_backend_mod, mock_atspi):
     """Test la gestion des erreurs"""
-    with patch('atspi_backend.Atspi.get_desktop', side_effect=Exception("Erreur de test")):
+    with swap_attr(atspi_backend_mod.Atspi, 'get_desktop', _raise_desktop_error):
         # Les erreurs ne devraient pas faire planter le programme
-        desktop = atspi_backend.get_desktop()
+        desktop = atspi_backend_mod.get_desktop()
         assert desktop is None
         
-        app = atspi_backend.find_application("Test")
+        app = atspi_backend_mod.find_application("Test")
         assert app is None
         
-        element = atspi_backend.get_focused_element()
+        element = atspi_backend_mod.get_focused_element()
         assert element is None
 
-def test_cleanup(mock_atspi):
+def test_cleanup(atspi_backend_mod, mock_atspi):
     """Test le nettoyage des ressources"""
-    with patch('atspi_backend.Atspi') as mock:
-        atspi_backend.initialize()
-        assert atspi_backend.cleanup()
+    with patch.object(atspi_backend_mod, 'Atspi') as mock:
+        atspi_backend_mod.initialize()
+        assert atspi_backend_mod.cleanup()
         
         # Vérifier que le nettoyage a été appelé
         mock.cleanup.assert_called_once() 
\ No newline at end of file
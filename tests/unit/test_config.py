@@ -6,20 +6,15 @@ Tests unitaires pour le module de configuration
 """
 
 import pytest
+import io
 import os
-import tempfile
 import json
 from pathlib import Path
-import sys
-
-# Ajouter le répertoire parent au PYTHONPATH
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
 import config
 
-def test_default_config():
+def test_default_config(default_config):
     """Test la configuration par défaut"""
-    default_config = config.get_config()
     assert 'voix' in default_config
     assert 'braille' in default_config
     assert 'haptique' in default_config
@@ -49,31 +44,36 @@ def test_config_validation():
     }
     assert not config.validate_config(invalid_config)
 
-def test_config_persistence():
+@pytest.fixture(scope="module")
+def config_tmpdir(tmp_path_factory):
+    """Répertoire temporaire partagé par les tests de persistance du module"""
+    return tmp_path_factory.mktemp("cfg")
+
+def test_config_persistence(config_tmpdir, request):
     """Test la persistance de la configuration"""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        config_path = Path(temp_dir) / 'config.json'
-        
-        # Configuration de test
-        test_config = {
-            'voix': {
-                'moteur': 'test_engine',
-                'langue': 'test_lang',
-                'vitesse': 150,
-                'volume': 80
-            }
+    # Un fichier par test pour rester isolé dans le répertoire partagé
+    config_path = config_tmpdir / f"{request.node.name}.json"
+    
+    # Configuration de test
+    test_config = {
+        'voix': {
+            'moteur': 'test_engine',
+            'langue': 'test_lang',
+            'vitesse': 150,
+            'volume': 80
         }
-        
-        # Sauvegarder la configuration
-        assert config.save_config(test_config, config_path)
-        
-        # Charger la configuration
-        loaded_config = config.load_config(config_path)
-        assert loaded_config is not None
-        assert loaded_config['voix']['moteur'] == 'test_engine'
-        assert loaded_config['voix']['langue'] == 'test_lang'
-        assert loaded_config['voix']['vitesse'] == 150
-        assert loaded_config['voix']['volume'] == 80
+    }
+    
+    # Sauvegarder la configuration
+    assert config.save_config(test_config, config_path)
+    
+    # Charger la configuration
+    loaded_config = config.load_config(config_path)
+    assert loaded_config is not None
+    assert loaded_config['voix']['moteur'] == 'test_engine'
+    assert loaded_config['voix']['langue'] == 'test_lang'
+    assert loaded_config['voix']['vitesse'] == 150
+    assert loaded_config['voix']['volume'] == 80
 
 def test_config_merge():
     """Test la fusion de configurations"""
@@ -119,11 +119,8 @@ def test_config_error_handling():
     # Test avec un fichier inexistant
     assert config.load_config('fichier_inexistant.json') is None
     
-    # Test avec un fichier invalide
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.json') as f:
-        f.write('invalid json')
-        f.flush()
-        assert config.load_config(f.name) is None
+    # Test avec un contenu invalide
+    assert config.load_config_from_stream(io.StringIO('invalid json')) is None
     
     # Test avec une configuration invalide
     invalid_config = {
@@ -132,27 +129,22 @@ def test_config_error_handling():
             'vitesse': 'invalid'  # Type invalide
         }
     }
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.json') as f:
-        json.dump(invalid_config, f)
-        f.flush()
-        assert not config.validate_config(config.load_config(f.name))
+    stream = io.StringIO(json.dumps(invalid_config))
+    assert not config.validate_config(config.load_config_from_stream(stream))
 
-def test_config_platform_specific():
+def test_config_platform_specific(platform_config):
     """Test la configuration spécifique à la plateforme"""
-    # Configuration de base
-    base_config = config.get_config()
-    
     # Configuration Linux
-    linux_config = config.get_platform_config('linux')
+    linux_config = platform_config('linux')
     assert 'linux' in linux_config['plateformes']
     assert linux_config['plateformes']['linux'] is True
     
     # Configuration Windows
-    windows_config = config.get_platform_config('windows')
+    windows_config = platform_config('windows')
     assert 'windows' in windows_config['plateformes']
     assert windows_config['plateformes']['windows'] is True
     
     # Configuration Android
-    android_config = config.get_platform_config('android')
+    android_config = platform_config('android')
     assert 'android' in android_config['plateformes']
     assert android_config['plateformes']['android'] is True 
\ No newline at end of file
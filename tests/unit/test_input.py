@@ -6,18 +6,14 @@ Tests unitaires pour le backend de gestion des entrées
 """
 
 import pytest
-from unittest.mock import patch, MagicMock
-import sys
-import os
-
-# Ajouter le répertoire parent au PYTHONPATH
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+from unittest.mock import MagicMock
 
 import input_listener
+from ..helpers import swap_attr
 
 def test_initialization(mock_input_manager):
     """Test l'initialisation du gestionnaire d'entrées"""
-    with patch('input_listener._input_manager', mock_input_manager):
+    with swap_attr(input_listener, '_input_manager', mock_input_manager):
         assert input_listener.initialize()
         assert mock_input_manager.is_listening
         assert input_listener.cleanup()
@@ -25,20 +21,20 @@ def test_initialization(mock_input_manager):
 
 def test_key_listening(mock_input_manager):
     """Test l'écoute des touches"""
-    with patch('input_listener._input_manager', mock_input_manager):
+    with swap_attr(input_listener, '_input_manager', mock_input_manager):
         input_listener.initialize()
         
-        # Simuler quelques touches
-        test_keys = ['a', 'b', 'c', 'Enter', 'Escape']
-        for key in test_keys:
-            mock_input_manager.simulate_key(key)
-            assert mock_input_manager.last_key == key
+        # Simuler quelques touches en un seul lot
+        test_keys = ('a', 'b', 'c', 'Enter', 'Escape')
+        mock_input_manager.simulate_keys(test_keys)
+        assert mock_input_manager.history == test_keys
+        assert mock_input_manager.last_key == 'Escape'
         
         input_listener.cleanup()
 
 def test_key_callback(mock_input_manager):
     """Test les callbacks de touches"""
-    with patch('input_listener._input_manager', mock_input_manager):
+    with swap_attr(input_listener, '_input_manager', mock_input_manager):
         # Créer un mock pour le callback
         callback_called = False
         last_key = None
@@ -64,7 +60,7 @@ def test_key_callback(mock_input_manager):
 
 def test_multiple_callbacks(mock_input_manager):
     """Test l'enregistrement de plusieurs callbacks"""
-    with patch('input_listener._input_manager', mock_input_manager):
+    with swap_attr(input_listener, '_input_manager', mock_input_manager):
         callbacks_called = []
         
         def callback1(key):
@@ -89,15 +85,27 @@ def test_multiple_callbacks(mock_input_manager):
         
         input_listener.cleanup()
 
+def test_register_key_handlers():
+    """Test l'enregistrement groupé de gestionnaires pour une même touche"""
+    # Le vrai gestionnaire a besoin des codes de touches d'evdev
+    ecodes = pytest.importorskip("evdev").ecodes
+    manager = input_listener.InputManager()
+    calls = []
+    
+    handlers = [lambda: calls.append('first'), lambda: calls.append('second')]
+    with swap_attr(input_listener, '_input_manager', manager):
+        assert input_listener.register_key_handlers('KEY_A', handlers)
+    
+    # Les deux gestionnaires sont appelés, dans l'ordre d'enregistrement
+    manager._trigger_key_handlers(ecodes.KEY_A)
+    assert calls == ['first', 'second']
+
 def test_error_handling(mock_input_manager):
     """Test la gestion des erreurs"""
-    with patch('input_listener._input_manager', mock_input_manager):
-        # Simuler une erreur dans le gestionnaire
-        mock_input_manager.start = MagicMock(return_value=False)
+    with swap_attr(input_listener, '_input_manager', mock_input_manager):
+        # Un seul mock : échec au premier démarrage, succès au second
+        mock_input_manager.start = MagicMock(side_effect=[False, True])
         assert not input_listener.initialize()
-        
-        # Réinitialiser le mock
-        mock_input_manager.start = MagicMock(return_value=True)
         assert input_listener.initialize()
         
         # Simuler une erreur lors de l'arrêt
@@ -106,7 +114,7 @@ def test_error_handling(mock_input_manager):
 
 def test_callback_error_handling(mock_input_manager):
     """Test la gestion des erreurs dans les callbacks"""
-    with patch('input_listener._input_manager', mock_input_manager):
+    with swap_attr(input_listener, '_input_manager', mock_input_manager):
         def error_callback(key):
             raise Exception("Erreur de test")
         
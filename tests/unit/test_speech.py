@@ -6,31 +6,27 @@ Tests unitaires pour le backend de synthèse vocale
 """
 
 import pytest
-from unittest.mock import patch, MagicMock
-import sys
-import os
-
-# Ajouter le répertoire parent au PYTHONPATH
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+from unittest.mock import MagicMock
 
 import speech_backend
+from ..helpers import swap_attr
 
 def test_initialization(mock_speech_engine, test_config):
     """Test l'initialisation du backend de synthèse vocale"""
-    with patch('speech_backend._speech_engine', mock_speech_engine):
+    with swap_attr(speech_backend, '_speech_engine', mock_speech_engine):
         assert speech_backend.initialize(test_config['voix'])
         assert speech_backend.cleanup()
 
 def test_say_text(mock_speech_engine):
     """Test la fonction de synthèse vocale"""
-    with patch('speech_backend._speech_engine', mock_speech_engine):
+    with swap_attr(speech_backend, '_speech_engine', mock_speech_engine):
         text = "Test de synthèse vocale"
         assert speech_backend.say(text)
         assert mock_speech_engine.last_spoken == text
 
 def test_stop_speech(mock_speech_engine):
     """Test l'arrêt de la synthèse vocale"""
-    with patch('speech_backend._speech_engine', mock_speech_engine):
+    with swap_attr(speech_backend, '_speech_engine', mock_speech_engine):
         # D'abord dire quelque chose
         speech_backend.say("Test")
         assert mock_speech_engine.last_spoken is not None
@@ -49,7 +45,7 @@ def test_invalid_config():
 
 def test_error_handling(mock_speech_engine):
     """Test la gestion des erreurs"""
-    with patch('speech_backend._speech_engine', mock_speech_engine):
+    with swap_attr(speech_backend, '_speech_engine', mock_speech_engine):
         # Simuler une erreur dans le moteur
         mock_speech_engine.speak = MagicMock(return_value=False)
         assert not speech_backend.say("Test")
@@ -60,7 +56,7 @@ def test_error_handling(mock_speech_engine):
 
 def test_multiple_initialization(mock_speech_engine, test_config):
     """Test l'initialisation multiple"""
-    with patch('speech_backend._speech_engine', mock_speech_engine):
+    with swap_attr(speech_backend, '_speech_engine', mock_speech_engine):
         # Première initialisation
         assert speech_backend.initialize(test_config['voix'])
         
@@ -71,4 +67,10 @@ def test_multiple_initialization(mock_speech_engine, test_config):
         assert speech_backend.cleanup()
         
         # Réinitialisation après nettoyage
-        assert speech_backend.initialize(test_config['voix']) 
\ No newline at end of file
+        assert speech_backend.initialize(test_config['voix']) 
+
+def test_engine_slots():
+    """Test l'absence de __dict__ sur les moteurs de synthèse vocale"""
+    for engine_class in (speech_backend.EspeakEngine, speech_backend.SpeechDispatcherEngine):
+        engine = engine_class()
+        assert not hasattr(engine, '__dict__')